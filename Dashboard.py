@@ -1,6 +1,8 @@
 # ============================
 # Imports & Page Config
 # ============================
+import os
+
 import streamlit as st
 import pandas as pd
 import plotly.express as px
@@ -84,14 +86,188 @@ st.markdown("""
 # ============================
 @st.cache_data
 def load_data():
-    reviews = pd.read_csv("data/spotify_reviews_multilabel.csv")
-    priority = pd.read_csv("data/priority_backlog.csv")
-    persistence = pd.read_csv("data/theme_persistence.csv")
-    version_signal = pd.read_csv("data/theme_version_signal.csv")
+    # Cold starts read a Parquet cache of the reviews table (typed, columnar,
+    # much faster than CSV parse); the cache is built from the CSV on first
+    # run and preserves the compact dtypes below. The filename carries a
+    # .dashboard infix: the agentic app keeps its own sidecar with a wider
+    # column set, and the two must not overwrite each other.
+    reviews_parquet = "data/spotify_reviews_multilabel.dashboard.parquet"
+    if os.path.exists(reviews_parquet):
+        reviews = pd.read_parquet(reviews_parquet)
+    else:
+        # Default C engine: the reviews CSV has multi-line quoted embedding
+        # fields, which the pyarrow reader rejects outright.
+        reviews = pd.read_csv(
+            "data/spotify_reviews_multilabel.csv",
+            usecols=["RC_ver", "theme_label", "final_weight", "score", "content"],
+            dtype={
+                "score": "int8",
+                "final_weight": "float32",
+                "RC_ver": "category",
+                "theme_label": "category",
+            },
+        )
+        # Ordered categories keep the sorted version list precomputed, so
+        # pages never need to re-sort the column.
+        reviews["RC_ver"] = reviews["RC_ver"].cat.reorder_categories(
+            sorted(reviews["RC_ver"].cat.categories), ordered=True
+        )
+        try:
+            reviews.to_parquet(reviews_parquet)
+        except OSError:
+            pass  # read-only deployment — keep serving from the CSV
+    priority = pd.read_csv(
+        "data/priority_backlog.csv",
+        dtype={"Is_Persistent": "bool", "Is_Regression": "bool"},
+        engine="pyarrow",
+    )
+    persistence = pd.read_csv(
+        "data/theme_persistence.csv",
+        dtype={"Is_Persistent": "bool"},
+        engine="pyarrow",
+    )
+    version_signal = pd.read_csv("data/theme_version_signal.csv", engine="pyarrow")
     return reviews, priority, persistence, version_signal
 
 reviews, priority, persistence, version_signal = load_data()
-df = reviews.copy()
+# Alias, not a copy — nothing below mutates the reviews frame in place.
+df = reviews
+
+VERSIONS = list(reviews["RC_ver"].cat.categories)
+LATEST_VERSION = VERSIONS[-1]
+
+# ============================
+# Precomputed Aggregates
+# ============================
+@st.cache_data
+def build_aggregates(reviews):
+    # Pain per (version, theme) and per-version stats, computed once per
+    # session so page reruns reduce to cheap lookups instead of groupbys.
+    pain_by_version_theme = (
+        reviews
+        .groupby(["RC_ver", "theme_label"], observed=True)["final_weight"]
+        .sum()
+        .unstack("theme_label", fill_value=0)
+    )
+    version_stats = reviews.groupby("RC_ver", observed=True).agg(
+        reviews=("score", "size"),
+        avg_rating=("score", "mean"),
+        pain=("final_weight", "sum"),
+    )
+    return pain_by_version_theme, version_stats
+
+pain_by_version_theme, version_stats = build_aggregates(reviews)
+
+@st.cache_data
+def top_reviews(reviews, k=20):
+    # Highest-weight reviews per (theme, version), matching the deep-dive
+    # slider maximum, so the interactive path never re-sorts the full table.
+    return (
+        reviews
+        .sort_values("final_weight", ascending=False)
+        .groupby(["theme_label", "RC_ver"], observed=True)
+        .head(k)
+        .set_index(["theme_label", "RC_ver"])
+        .sort_index()
+    )
+
+top_reviews_by_group = top_reviews(reviews)
+
+def downsample(frame, n=2000):
+    # Cap the rows handed to Plotly so browser render time stays bounded
+    # as the data grows; a no-op for today's aggregate-sized frames.
+    if len(frame) <= n:
+        return frame
+    step = -(-len(frame) // n)
+    return frame.iloc[::step]
+
+# ============================
+# Cached Figure Builders
+# ============================
+# Figures are built from small aggregate frames, so hashing those frames is
+# cheap and unchanged selections reuse the cached figure JSON.
+_DF_HASH = {pd.DataFrame: lambda d: pd.util.hash_pandas_object(d, index=True).sum()}
+
+@st.cache_resource
+def chart_defaults():
+    # Static palettes and layout kwargs shared across charts; built once
+    # per server instead of per rerun.
+    return {
+        "pie_colors": px.colors.qualitative.Set2,
+        "rating_colorscale": "RdYlGn",
+        "trend_layout": dict(xaxis_tickangle=-45, xaxis_title="App Version"),
+    }
+
+@st.cache_data(hash_funcs=_DF_HASH)
+def make_version_bar(version_counts):
+    fig = px.bar(
+        version_counts,
+        x="RC_ver",
+        y="count",
+        color="count",
+        color_continuous_scale="Blues"
+    )
+    fig.update_layout(
+        xaxis_tickangle=-45,
+        height=350,
+        showlegend=False,
+        xaxis_title="App Version",
+        yaxis_title="Number of Reviews"
+    )
+    fig.update_coloraxes(showscale=False)
+    return fig
+
+@st.cache_data(hash_funcs=_DF_HASH)
+def make_pain_pie(theme_pain):
+    fig = px.pie(
+        theme_pain,
+        values="final_weight",
+        names="theme_label",
+        hole=0.4,
+        color_discrete_sequence=chart_defaults()["pie_colors"]
+    )
+    fig.update_layout(height=350)
+    return fig
+
+@st.cache_data(hash_funcs=_DF_HASH)
+def make_summary_pain_bar(summary_pain):
+    fig = px.bar(
+        summary_pain,
+        x="final_weight",
+        y="theme_label",
+        orientation="h",
+        color="final_weight",
+        color_continuous_scale="Reds"
+    )
+    fig.update_layout(
+        height=400,
+        xaxis_title="Total Weighted User Pain",
+        yaxis_title="",
+        showlegend=False
+    )
+    fig.update_coloraxes(showscale=False)
+    return fig
+
+@st.cache_data(hash_funcs=_DF_HASH)
+def make_health_pain_bar(health_pain, selected_version):
+    fig = px.bar(
+        health_pain,
+        x="theme_label",
+        y="final_weight",
+        color="percentage",
+        color_continuous_scale="Viridis",
+        text=health_pain["percentage"].apply(lambda x: f"{x:.1f}%")
+    )
+    fig.update_layout(
+        title=f"Release Health — Version {selected_version}",
+        xaxis_tickangle=-45,
+        height=450,
+        xaxis_title="Product Area",
+        yaxis_title="Total Weighted User Pain"
+    )
+    fig.update_traces(textposition="outside")
+    fig.update_coloraxes(showscale=False)
+    return fig
 
 # ============================
 # Sidebar Navigation
@@ -115,13 +291,19 @@ page = st.sidebar.radio(
 
 st.sidebar.markdown("---")
 st.sidebar.markdown("### Quick Stats")
-total_reviews = len(df)
-total_versions = df["RC_ver"].nunique()
-total_themes = df["theme_label"].nunique()
 
-st.sidebar.metric("Total Reviews", f"{total_reviews:,}")
-st.sidebar.metric("App Versions", total_versions)
-st.sidebar.metric("Theme Categories", total_themes)
+@st.cache_data
+def sidebar_stats(df):
+    return {
+        "rows": len(df),
+        "versions": df["RC_ver"].nunique(),
+        "themes": df["theme_label"].nunique(),
+    }
+
+stats = sidebar_stats(df)
+st.sidebar.metric("Total Reviews", f"{stats['rows']:,}")
+st.sidebar.metric("App Versions", stats["versions"])
+st.sidebar.metric("Theme Categories", stats["themes"])
 
 st.sidebar.markdown("---")
 st.sidebar.caption("ReleasePulse — Internal PM Tool")
@@ -146,10 +328,10 @@ if page == "Home":
     # Key metrics row
     col1, col2, col3, col4 = st.columns(4)
     
-    latest_version = sorted(df["RC_ver"].dropna().unique())[-1]
-    latest_reviews = len(df[df["RC_ver"] == latest_version])
-    avg_rating = df[df["RC_ver"] == latest_version]["score"].mean()
-    persistent_issues = persistence[persistence["Is_Persistent"] == True].shape[0]
+    latest_version = LATEST_VERSION
+    latest_reviews = version_stats.loc[latest_version, "reviews"]
+    avg_rating = version_stats.loc[latest_version, "avg_rating"]
+    persistent_issues = int(persistence["Is_Persistent"].sum())
     
     with col1:
         st.metric(
@@ -186,40 +368,18 @@ if page == "Home":
     
     with col1:
         st.subheader("Reviews by Version")
-        version_counts = df.groupby("RC_ver").size().reset_index(name="count")
-        version_counts = version_counts.sort_values("RC_ver")
-        
-        fig = px.bar(
-            version_counts,
-            x="RC_ver",
-            y="count",
-            color="count",
-            color_continuous_scale="Blues"
-        )
-        fig.update_layout(
-            xaxis_tickangle=-45,
-            height=350,
-            showlegend=False,
-            xaxis_title="App Version",
-            yaxis_title="Number of Reviews"
-        )
-        fig.update_coloraxes(showscale=False)
-        st.plotly_chart(fig, use_container_width=True)
+        # version_stats is indexed by the ordered RC_ver categorical, so the
+        # rows already come out in ascending release order.
+        version_counts = version_stats["reviews"].rename("count").reset_index()
+
+        st.plotly_chart(make_version_bar(version_counts), use_container_width=True)
     
     with col2:
         st.subheader("Pain Distribution by Theme")
-        theme_pain = df.groupby("theme_label")["final_weight"].sum().reset_index()
+        theme_pain = df.groupby("theme_label", observed=True)["final_weight"].sum().reset_index()
         theme_pain = theme_pain.sort_values("final_weight", ascending=True)
-        
-        fig = px.pie(
-            theme_pain,
-            values="final_weight",
-            names="theme_label",
-            hole=0.4,
-            color_discrete_sequence=px.colors.qualitative.Set2
-        )
-        fig.update_layout(height=350)
-        st.plotly_chart(fig, use_container_width=True)
+
+        st.plotly_chart(make_pain_pie(theme_pain), use_container_width=True)
     
     st.info("Use the sidebar navigation to explore detailed insights")
 
@@ -308,7 +468,7 @@ elif page == "About":
 elif page == "Executive Summary":
     st.title("Executive Summary")
     
-    latest_version = sorted(df["RC_ver"].dropna().unique())[-1]
+    latest_version = LATEST_VERSION
     latest_df = df[df["RC_ver"] == latest_version]
     
     st.markdown(f"### Release: **{latest_version}**")
@@ -316,59 +476,42 @@ elif page == "Executive Summary":
     # Key metrics
     col1, col2, col3, col4 = st.columns(4)
     
+    latest_stats = version_stats.loc[latest_version]
+    summary_pain = (
+        pain_by_version_theme.loc[latest_version]
+        .rename("final_weight")
+        .sort_values(ascending=True)
+        .reset_index()
+    )
+
     with col1:
-        total_reviews = len(latest_df)
-        st.metric("Total Reviews", f"{total_reviews:,}")
-    
+        st.metric("Total Reviews", f"{latest_stats['reviews']:,}")
+
     with col2:
-        avg_rating = latest_df["score"].mean()
+        avg_rating = latest_stats["avg_rating"]
         st.metric("Average Rating", f"{avg_rating:.2f}")
-    
+
     with col3:
-        total_pain = latest_df["final_weight"].sum()
-        st.metric("Total Pain Score", f"{total_pain:.0f}")
-    
+        st.metric("Total Pain Score", f"{latest_stats['pain']:.0f}")
+
     with col4:
-        top_theme = latest_df.groupby("theme_label")["final_weight"].sum().idxmax()
+        # summary_pain is sorted ascending, so the last row is the top area
+        top_theme = summary_pain.iloc[-1]["theme_label"]
         st.metric("Top Pain Area", top_theme[:15] + "..." if len(top_theme) > 15 else top_theme)
-    
+
     st.markdown("---")
-    
+
     col1, col2 = st.columns([2, 1])
-    
+
     with col1:
         st.subheader("User Pain by Product Area")
-        
-        summary_pain = (
-            latest_df
-            .groupby("theme_label")["final_weight"]
-            .sum()
-            .sort_values(ascending=True)
-            .reset_index()
-        )
-        
-        fig = px.bar(
-            summary_pain,
-            x="final_weight",
-            y="theme_label",
-            orientation="h",
-            color="final_weight",
-            color_continuous_scale="Reds"
-        )
-        
-        fig.update_layout(
-            height=400,
-            xaxis_title="Total Weighted User Pain",
-            yaxis_title="",
-            showlegend=False
-        )
-        fig.update_coloraxes(showscale=False)
-        st.plotly_chart(fig, use_container_width=True)
+
+        st.plotly_chart(make_summary_pain_bar(summary_pain), use_container_width=True)
     
     with col2:
         st.subheader("Rating Distribution")
         
-        rating_dist = latest_df["score"].value_counts().sort_index().reset_index()
+        rating_dist = latest_df["score"].value_counts(sort=False).sort_index().reset_index()
         rating_dist.columns = ["Rating", "Count"]
         
         fig = px.bar(
@@ -376,7 +519,7 @@ elif page == "Executive Summary":
             x="Rating",
             y="Count",
             color="Rating",
-            color_continuous_scale="RdYlGn"
+            color_continuous_scale=chart_defaults()["rating_colorscale"]
         )
         fig.update_layout(height=400, showlegend=False)
         fig.update_coloraxes(showscale=False)
@@ -405,84 +548,71 @@ elif page == "Executive Summary":
 # 4. RELEASE HEALTH
 # ============================
 elif page == "Release Health":
-    st.title("Release Health — Diagnostic View")
-    
-    st.markdown("""
-    Analyze **where user pain is concentrated** for any selected release.
-    Uses weighted user feedback (severity × validation).
-    """)
-    
-    versions = sorted(df["RC_ver"].dropna().unique(), reverse=True)
-    
-    col1, col2 = st.columns([1, 3])
-    
-    with col1:
-        selected_version = st.selectbox(
-            "Select App Version",
-            versions,
-            index=0
-        )
-        
-        # Version stats
-        version_df = df[df["RC_ver"] == selected_version]
-        st.markdown("---")
-        st.markdown("**Version Stats:**")
-        st.metric("Reviews", len(version_df))
-        st.metric("Avg Rating", f"{version_df['score'].mean():.2f}")
-        st.metric("Pain Score", f"{version_df['final_weight'].sum():.0f}")
-    
-    with col2:
-        health_pain = (
-            version_df
-            .groupby("theme_label")["final_weight"]
-            .sum()
-            .sort_values(ascending=False)
-            .reset_index()
-        )
-        
-        # Add percentage
-        health_pain["percentage"] = 100 * health_pain["final_weight"] / health_pain["final_weight"].sum()
-        
-        fig = px.bar(
-            health_pain,
-            x="theme_label",
-            y="final_weight",
-            color="percentage",
-            color_continuous_scale="Viridis",
-            text=health_pain["percentage"].apply(lambda x: f"{x:.1f}%")
-        )
-        
-        fig.update_layout(
-            title=f"Release Health — Version {selected_version}",
-            xaxis_tickangle=-45,
-            height=450,
-            xaxis_title="Product Area",
-            yaxis_title="Total Weighted User Pain"
-        )
-        fig.update_traces(textposition="outside")
-        fig.update_coloraxes(showscale=False)
-        st.plotly_chart(fig, use_container_width=True)
-    
-    st.markdown("---")
-    
-    # Comparison with previous version
-    st.subheader("Version Comparison")
-    
-    if len(versions) > 1:
-        prev_version = versions[1] if versions[0] == selected_version else versions[0]
-        
-        col1, col2 = st.columns(2)
-        
+    # Fragment-scoped: widget changes here rerun only this page,
+    # not the whole script.
+    @st.fragment
+    def _release_health_page():
+        st.title("Release Health — Diagnostic View")
+
+        st.markdown("""
+        Analyze **where user pain is concentrated** for any selected release.
+        Uses weighted user feedback (severity × validation).
+        """)
+
+        versions = VERSIONS[::-1]
+
+        col1, col2 = st.columns([1, 3])
+
         with col1:
-            st.markdown(f"**Current: {selected_version}**")
-            current_pain = version_df.groupby("theme_label")["final_weight"].sum()
-            st.dataframe(current_pain.reset_index().rename(columns={"final_weight": "Pain Score"}), hide_index=True)
-        
+            selected_version = st.selectbox(
+                "Select App Version",
+                versions,
+                index=0
+            )
+
+            # Version stats
+            selected_stats = version_stats.loc[selected_version]
+            st.markdown("---")
+            st.markdown("**Version Stats:**")
+            st.metric("Reviews", int(selected_stats["reviews"]))
+            st.metric("Avg Rating", f"{selected_stats['avg_rating']:.2f}")
+            st.metric("Pain Score", f"{selected_stats['pain']:.0f}")
+
         with col2:
-            st.markdown(f"**Previous: {prev_version}**")
-            prev_df = df[df["RC_ver"] == prev_version]
-            prev_pain = prev_df.groupby("theme_label")["final_weight"].sum()
-            st.dataframe(prev_pain.reset_index().rename(columns={"final_weight": "Pain Score"}), hide_index=True)
+            health_pain = (
+                pain_by_version_theme.loc[selected_version]
+                .rename("final_weight")
+                .sort_values(ascending=False)
+                .reset_index()
+            )
+
+            # Add percentage
+            health_pain["percentage"] = 100 * health_pain["final_weight"] / health_pain["final_weight"].sum()
+
+            st.plotly_chart(make_health_pain_bar(health_pain, selected_version), use_container_width=True)
+
+        st.markdown("---")
+
+        # Comparison with previous version
+        st.subheader("Version Comparison")
+
+        if len(versions) > 1:
+            prev_version = versions[1] if versions[0] == selected_version else versions[0]
+
+            col1, col2 = st.columns(2)
+
+            with col1:
+                st.markdown(f"**Current: {selected_version}**")
+                current_pain = pain_by_version_theme.loc[selected_version].rename("final_weight")
+                st.dataframe(current_pain.reset_index().rename(columns={"final_weight": "Pain Score"}), hide_index=True)
+
+            with col2:
+                st.markdown(f"**Previous: {prev_version}**")
+                prev_pain = pain_by_version_theme.loc[prev_version].rename("final_weight")
+                st.dataframe(prev_pain.reset_index().rename(columns={"final_weight": "Pain Score"}), hide_index=True)
+
+    _release_health_page()
+
 
 # ============================
 # 5. PRIORITY ROADMAP
@@ -494,23 +624,31 @@ elif page == "Priority Roadmap":
     Convert release insights into a **ranked fix order** using a RICE-style prioritization framework.
     """)
     
+    @st.cache_data
+    def priority_summary(priority):
+        return dict(
+            n=len(priority),
+            persistent=int(priority["Is_Persistent"].sum()),
+            regression=int(priority["Is_Regression"].sum()),
+            avg_effort=float(priority["Effort"].mean()),
+        )
+
+    summary = priority_summary(priority)
+
     # Summary metrics
     col1, col2, col3, col4 = st.columns(4)
-    
+
     with col1:
-        st.metric("Total Themes", len(priority))
-    
+        st.metric("Total Themes", summary["n"])
+
     with col2:
-        persistent_count = priority["Is_Persistent"].sum()
-        st.metric("Persistent Issues", int(persistent_count))
-    
+        st.metric("Persistent Issues", summary["persistent"])
+
     with col3:
-        regression_count = priority["Is_Regression"].sum()
-        st.metric("Regressions", int(regression_count))
-    
+        st.metric("Regressions", summary["regression"])
+
     with col4:
-        avg_effort = priority["Effort"].mean()
-        st.metric("Avg Effort", f"{avg_effort:.1f}")
+        st.metric("Avg Effort", f"{summary['avg_effort']:.1f}")
     
     st.markdown("---")
     
@@ -542,7 +680,13 @@ elif page == "Priority Roadmap":
     with col2:
         st.subheader("Effort Distribution")
         
-        effort_dist = priority.groupby("Effort").size().reset_index(name="Count")
+        effort_dist = (
+            priority["Effort"]
+            .value_counts(sort=False)
+            .sort_index()
+            .rename_axis("Effort")
+            .reset_index(name="Count")
+        )
         
         fig = px.pie(
             effort_dist,
@@ -559,15 +703,20 @@ elif page == "Priority Roadmap":
     # Detailed table
     st.subheader("Detailed Priority Backlog")
     
-    display_priority = priority.copy()
-    display_priority["Priority_Score"] = display_priority["Priority_Score"].apply(lambda x: f"{x:.4f}")
-    display_priority["Reach"] = display_priority["Reach"].apply(lambda x: f"{x:.2%}")
-    display_priority["Impact"] = display_priority["Impact"].apply(lambda x: f"{x:.2f}")
-    display_priority["Confidence"] = display_priority["Confidence"].apply(lambda x: f"{x:.2%}")
-    
+    @st.cache_data
+    def formatted_priority(priority):
+        # priority is static, so the display formatting happens once per
+        # session instead of re-running per-row lambdas on every rerun.
+        p = priority[["theme", "Priority_Score", "Reach", "Impact", "Confidence", "Effort", "Is_Persistent", "Is_Regression"]].copy()
+        p = p.sort_values("Priority_Score", ascending=False)
+        p["Priority_Score"] = p["Priority_Score"].map("{:.4f}".format)
+        p["Reach"] = p["Reach"].map("{:.2%}".format)
+        p["Impact"] = p["Impact"].map("{:.2f}".format)
+        p["Confidence"] = p["Confidence"].map("{:.2%}".format)
+        return p
+
     st.dataframe(
-        display_priority[["theme", "Priority_Score", "Reach", "Impact", "Confidence", "Effort", "Is_Persistent", "Is_Regression"]]
-        .sort_values("Priority_Score", ascending=False),
+        formatted_priority(priority),
         use_container_width=True,
         hide_index=True
     )
@@ -584,188 +733,182 @@ elif page == "Priority Roadmap":
 # 6. TREND ANALYSIS
 # ============================
 elif page == "Trend Analysis":
-    st.title("Trend Analysis")
-    
-    st.markdown("Track **theme signals across releases** to identify patterns and regressions.")
-    
-    # Theme selector
-    themes = sorted(version_signal["theme"].unique())
-    selected_themes = st.multiselect(
-        "Select Themes to Compare",
-        themes,
-        default=themes[:3]
-    )
-    
-    if selected_themes:
-        # Filter data
-        trend_data = version_signal[version_signal["theme"].isin(selected_themes)]
-        
+    # Fragment-scoped: widget changes here rerun only this page,
+    # not the whole script.
+    @st.fragment
+    def _trend_analysis_page():
+        st.title("Trend Analysis")
+
+        st.markdown("Track **theme signals across releases** to identify patterns and regressions.")
+
+        # Theme selector
+        themes = sorted(version_signal["theme"].unique())
+        selected_themes = st.multiselect(
+            "Select Themes to Compare",
+            themes,
+            default=themes[:3]
+        )
+
+        @st.cache_data
+        def trend_index(version_signal):
+            # One sorted sub-frame per theme, so a theme selection is a dict
+            # lookup instead of an isin scan over the whole signal table.
+            return {t: g.sort_values("RC_ver") for t, g in version_signal.groupby("theme")}
+
+        if selected_themes:
+            trends = trend_index(version_signal)
+            trend_data = downsample(version_signal[version_signal["theme"].isin(selected_themes)])
+
+            def trend_fig(metric, yaxis_title, height):
+                # Scattergl renders through WebGL, keeping the browser responsive
+                # when many themes are selected.
+                fig = go.Figure()
+                for t in selected_themes:
+                    g = trends[t]
+                    fig.add_trace(go.Scattergl(
+                        x=g["RC_ver"], y=g[metric], name=t, mode="lines+markers"
+                    ))
+                fig.update_layout(height=height, yaxis_title=yaxis_title, **chart_defaults()["trend_layout"])
+                return fig
+
+            col1, col2 = st.columns(2)
+
+            with col1:
+                st.subheader("Normalized Signal Over Time")
+                st.plotly_chart(trend_fig("Normalized_Signal", "Normalized Signal", 400), use_container_width=True)
+
+            with col2:
+                st.subheader("Review Count Trend")
+                st.plotly_chart(trend_fig("Review_Count", "Review Count", 400), use_container_width=True)
+
+            st.markdown("---")
+
+            # Average rating trend
+            st.subheader("Average Rating Trend by Theme")
+
+            st.plotly_chart(trend_fig("Avg_Rating", "Average Rating", 350), use_container_width=True)
+
+            # Delta analysis
+            st.markdown("---")
+            st.subheader("Signal Delta (Version over Version)")
+
+            delta_data = trend_data[trend_data["Delta"].notna()]
+
+            if not delta_data.empty:
+                fig = px.bar(
+                    delta_data,
+                    x="RC_ver",
+                    y="Delta",
+                    color="theme",
+                    barmode="group"
+                )
+                fig.update_layout(height=350, yaxis_title="Signal Change", **chart_defaults()["trend_layout"])
+                fig.add_hline(y=0, line_dash="dash", line_color="gray")
+                st.plotly_chart(fig, use_container_width=True)
+
+                st.caption("Positive delta = worsening signal | Negative delta = improving")
+        else:
+            st.warning("Please select at least one theme to view trends.")
+
+    _trend_analysis_page()
+
+
+# ============================
+# 7. THEME DEEP DIVE
+# ============================
+elif page == "Theme Deep Dive":
+    # Fragment-scoped: widget changes here rerun only this page,
+    # not the whole script.
+    @st.fragment
+    def _theme_deep_dive_page():
+        st.title("Theme Deep Dive — User Evidence")
+
+        st.markdown("""
+        Explore **raw user feedback** to validate and contextualize the signals shown elsewhere.
+        """)
+
         col1, col2 = st.columns(2)
-        
+
+        THEMES = sorted(df["theme_label"].dropna().unique())
+
         with col1:
-            st.subheader("Normalized Signal Over Time")
-            
-            fig = px.line(
-                trend_data,
-                x="RC_ver",
-                y="Normalized_Signal",
-                color="theme",
-                markers=True
-            )
-            fig.update_layout(
-                height=400,
-                xaxis_tickangle=-45,
-                xaxis_title="App Version",
-                yaxis_title="Normalized Signal"
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        
+            selected_theme = st.selectbox("Select Theme", THEMES)
+
         with col2:
-            st.subheader("Review Count Trend")
-            
-            fig = px.line(
-                trend_data,
-                x="RC_ver",
-                y="Review_Count",
-                color="theme",
-                markers=True
-            )
-            fig.update_layout(
-                height=400,
-                xaxis_tickangle=-45,
-                xaxis_title="App Version",
-                yaxis_title="Review Count"
+            selected_version = st.selectbox("Select Version", VERSIONS[::-1])
+
+        # Filter data (metrics only; the review list reads the cached top-K table)
+        deep_dive = df[
+            (df["theme_label"] == selected_theme) &
+            (df["RC_ver"] == selected_version)
+        ]
+
+        if (selected_theme, selected_version) in top_reviews_by_group.index:
+            top_selection = (
+                top_reviews_by_group
+                .loc[[(selected_theme, selected_version)]]
+                .sort_values("final_weight", ascending=False)
             )
-            st.plotly_chart(fig, use_container_width=True)
-        
+        else:
+            top_selection = top_reviews_by_group.iloc[0:0]
+
         st.markdown("---")
-        
-        # Average rating trend
-        st.subheader("Average Rating Trend by Theme")
-        
-        fig = px.line(
-            trend_data,
-            x="RC_ver",
-            y="Avg_Rating",
-            color="theme",
-            markers=True
-        )
-        fig.update_layout(
-            height=350,
-            xaxis_tickangle=-45,
-            xaxis_title="App Version",
-            yaxis_title="Average Rating"
-        )
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # Delta analysis
+
+        # Stats for this selection
+        col1, col2, col3, col4 = st.columns(4)
+
+        with col1:
+            st.metric("Total Reviews", len(deep_dive))
+
+        with col2:
+            st.metric("Avg Rating", f"{deep_dive['score'].mean():.2f}" if len(deep_dive) > 0 else "N/A")
+
+        with col3:
+            st.metric("Total Pain", f"{deep_dive['final_weight'].sum():.1f}")
+
+        with col4:
+            # Check persistence
+            is_persistent = persistence[persistence["theme"] == selected_theme]["Is_Persistent"].values
+            st.metric("Persistent?", "Yes" if len(is_persistent) > 0 and is_persistent[0] else "No")
+
         st.markdown("---")
-        st.subheader("Signal Delta (Version over Version)")
-        
-        delta_data = trend_data[trend_data["Delta"].notna()]
-        
-        if not delta_data.empty:
+
+        # Top reviews
+        num_reviews = st.slider("Number of reviews to display", 5, 20, 10)
+
+        st.subheader(f"Top {num_reviews} High-Impact Reviews")
+
+        if len(top_selection) > 0:
+            for idx, row in top_selection.head(num_reviews).iterrows():
+                rating = int(row["score"])
+                weight = row["final_weight"]
+
+                with st.expander(f"Rating: {rating}/5 — Pain Weight: {weight:.2f}"):
+                    st.markdown(f"**Review:**")
+                    st.write(row["content"])
+                    st.markdown(f"**Score:** {row['score']} | **Weight:** {weight:.2f}")
+        else:
+            st.info("No reviews found for this combination.")
+
+        st.markdown("---")
+
+        # Word cloud or rating distribution
+        st.subheader("Rating Distribution for Selection")
+
+        if len(deep_dive) > 0:
+            rating_counts = deep_dive["score"].value_counts(sort=False).sort_index().reset_index()
+            rating_counts.columns = ["Rating", "Count"]
+
             fig = px.bar(
-                delta_data,
-                x="RC_ver",
-                y="Delta",
-                color="theme",
-                barmode="group"
+                rating_counts,
+                x="Rating",
+                y="Count",
+                color="Rating",
+                color_continuous_scale=chart_defaults()["rating_colorscale"]
             )
-            fig.update_layout(
-                height=350,
-                xaxis_tickangle=-45,
-                xaxis_title="App Version",
-                yaxis_title="Signal Change"
-            )
-            fig.add_hline(y=0, line_dash="dash", line_color="gray")
+            fig.update_layout(height=300, showlegend=False)
+            fig.update_coloraxes(showscale=False)
             st.plotly_chart(fig, use_container_width=True)
-            
-            st.caption("Positive delta = worsening signal | Negative delta = improving")
-    else:
-        st.warning("Please select at least one theme to view trends.")
 
-# ============================
-# 7. THEME DEEP DIVE
-# ============================
-elif page == "Theme Deep Dive":
-    st.title("Theme Deep Dive — User Evidence")
-    
-    st.markdown("""
-    Explore **raw user feedback** to validate and contextualize the signals shown elsewhere.
-    """)
-    
-    col1, col2 = st.columns(2)
-    
-    THEMES = sorted(df["theme_label"].dropna().unique())
-    VERSIONS = sorted(df["RC_ver"].dropna().unique(), reverse=True)
-    
-    with col1:
-        selected_theme = st.selectbox("Select Theme", THEMES)
-    
-    with col2:
-        selected_version = st.selectbox("Select Version", VERSIONS)
-    
-    # Filter data
-    deep_dive = df[
-        (df["theme_label"] == selected_theme) &
-        (df["RC_ver"] == selected_version)
-    ].sort_values("final_weight", ascending=False)
-    
-    st.markdown("---")
-    
-    # Stats for this selection
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric("Total Reviews", len(deep_dive))
-    
-    with col2:
-        st.metric("Avg Rating", f"{deep_dive['score'].mean():.2f}" if len(deep_dive) > 0 else "N/A")
-    
-    with col3:
-        st.metric("Total Pain", f"{deep_dive['final_weight'].sum():.1f}")
-    
-    with col4:
-        # Check persistence
-        is_persistent = persistence[persistence["theme"] == selected_theme]["Is_Persistent"].values
-        st.metric("Persistent?", "Yes" if len(is_persistent) > 0 and is_persistent[0] else "No")
-    
-    st.markdown("---")
-    
-    # Top reviews
-    num_reviews = st.slider("Number of reviews to display", 5, 20, 10)
-    
-    st.subheader(f"Top {num_reviews} High-Impact Reviews")
-    
-    if len(deep_dive) > 0:
-        for idx, row in deep_dive.head(num_reviews).iterrows():
-            rating = int(row["score"])
-            weight = row["final_weight"]
-            
-            with st.expander(f"Rating: {rating}/5 — Pain Weight: {weight:.2f}"):
-                st.markdown(f"**Review:**")
-                st.write(row["content"])
-                st.markdown(f"**Score:** {row['score']} | **Weight:** {weight:.2f}")
-    else:
-        st.info("No reviews found for this combination.")
-    
-    st.markdown("---")
-    
-    # Word cloud or rating distribution
-    st.subheader("Rating Distribution for Selection")
-    
-    if len(deep_dive) > 0:
-        rating_counts = deep_dive["score"].value_counts().sort_index().reset_index()
-        rating_counts.columns = ["Rating", "Count"]
-        
-        fig = px.bar(
-            rating_counts,
-            x="Rating",
-            y="Count",
-            color="Rating",
-            color_continuous_scale="RdYlGn"
-        )
-        fig.update_layout(height=300, showlegend=False)
-        fig.update_coloraxes(showscale=False)
-        st.plotly_chart(fig, use_container_width=True)
+    _theme_deep_dive_page()
+
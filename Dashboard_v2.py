@@ -9,10 +9,9 @@
 # ============================
 
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 from datetime import datetime
 
 st.set_page_config(
@@ -119,16 +118,286 @@ st.markdown("""
 # ============================
 # Load Data
 # ============================
-@st.cache_data
+# cache_resource hands every rerun the same frame objects instead of a fresh
+# unpickled copy, which is what keeps the id()-keyed caches below valid. The
+# frames are treated as read-only; no page mutates them.
+@st.cache_resource
 def load_data():
     reviews = pd.read_csv("data/spotify_reviews_multilabel.csv")
     priority = pd.read_csv("data/priority_backlog.csv")
     persistence = pd.read_csv("data/theme_persistence.csv")
     version_signal = pd.read_csv("data/theme_version_signal.csv")
+    # Narrow numerics: score fits int8 and final_weight float32, so the
+    # full-column scans and histograms read an eighth/half the bytes.
+    reviews = reviews.astype({"score": "int8", "final_weight": "float32"})
+    priority["Effort"] = priority["Effort"].astype("int8")
+    # theme_label is six repeated strings; as a categorical, groupbys hash
+    # int codes instead of strings and the column shrinks to 1 byte/row.
+    reviews["theme_label"] = reviews["theme_label"].astype("category")
+    # High-cardinality review text goes to the Arrow-backed string dtype:
+    # one contiguous buffer instead of a Python object per row.
+    reviews["content"] = reviews["content"].astype("string[pyarrow]")
+    # Ordered categorical: version filters compare int codes, and the sorted
+    # version list is free via .cat.categories instead of a unique+sort scan.
+    reviews["RC_ver"] = pd.Categorical(
+        reviews["RC_ver"],
+        categories=sorted(reviews["RC_ver"].dropna().unique()),
+        ordered=True,
+    )
+    # Same treatment for the signal table: Trend Analysis filters it by
+    # theme and version on every rerun, and categorical isin/== compares
+    # int codes instead of Python strings.
+    version_signal["theme"] = version_signal["theme"].astype("category")
+    version_signal["RC_ver"] = pd.Categorical(
+        version_signal["RC_ver"],
+        categories=sorted(version_signal["RC_ver"].dropna().unique()),
+        ordered=True,
+    )
     return reviews, priority, persistence, version_signal
 
 reviews, priority, persistence, version_signal = load_data()
-df = reviews.copy()
+df = reviews  # read-only alias; no page mutates the cached frame
+
+# Optional JIT path for the pain-matrix reduction. np.add.at is unbuffered
+# and slows down on large review datasets; when numba is installed, a
+# parallel chunked accumulator (per-thread partials summed at the end, so
+# no write contention) takes over. numba is not a hard dependency — without
+# it we fall back to the plain numpy scatter-add.
+try:
+    from numba import njit, prange
+
+    @njit(parallel=True, cache=True)
+    def _accumulate_pain(codes, ver_codes, weights, n_themes, n_versions, n_chunks):
+        out = np.zeros((n_chunks, n_themes, n_versions))
+        chunk = (codes.shape[0] + n_chunks - 1) // n_chunks
+        for c in prange(n_chunks):
+            start = c * chunk
+            end = min(start + chunk, codes.shape[0])
+            for i in range(start, end):
+                out[c, codes[i], ver_codes[i]] += weights[i]
+        return out.sum(axis=0)
+except ImportError:
+    _accumulate_pain = None
+
+# One theme×version pain pivot computed up front; every page slices a column
+# from it instead of re-running filter + groupby over the review frame. The
+# frame is stable per process, so hashing by identity is enough.
+@st.cache_data(hash_funcs={pd.DataFrame: id})
+def build_pain_pivot(frame):
+    # Scatter-add on the raw categorical codes instead of pivot_table: a
+    # single pass over three flat arrays with no groupby dispatch. Cells
+    # with no observations stay NaN so the dropna parity in pain_by_theme
+    # keeps matching groupby output.
+    themes = frame["theme_label"].cat.categories
+    versions = frame["RC_ver"].cat.categories
+    codes = frame["theme_label"].cat.codes.to_numpy()
+    ver_codes = frame["RC_ver"].cat.codes.to_numpy()
+    weights = frame["final_weight"].to_numpy(dtype=np.float64)
+    valid = (codes >= 0) & (ver_codes >= 0)  # code -1 marks NaN keys, which pivot_table drops
+    codes, ver_codes, weights = codes[valid].astype(np.int64), ver_codes[valid].astype(np.int64), weights[valid]
+    if _accumulate_pain is not None:
+        out = _accumulate_pain(codes, ver_codes, weights, len(themes), len(versions), 8)
+    else:
+        out = np.zeros((len(themes), len(versions)))
+        np.add.at(out, (codes, ver_codes), weights)
+    seen = np.zeros((len(themes), len(versions)))
+    np.add.at(seen, (codes, ver_codes), 1.0)
+    out[seen == 0] = np.nan
+    return pd.DataFrame(out, index=pd.Index(themes, name="theme_label"), columns=pd.Index(versions, name="RC_ver"))
+
+def pain_by_theme(frame, version):
+    # O(themes) column slice off the pivot — no frame scan. dropna keeps
+    # parity with groupby, which only emits observed themes.
+    return build_pain_pivot(frame)[version].dropna().rename("final_weight")
+
+# Subframes keyed by version — O(1) dict lookup per rerun instead of
+# allocating a full-length boolean mask for every df[df["RC_ver"] == v].
+@st.cache_resource(hash_funcs={pd.DataFrame: id})
+def version_index(frame):
+    return {v: g for v, g in frame.groupby("RC_ver", sort=False, observed=True)}
+
+version_groups = version_index(df)
+
+# (theme, version)-indexed view for the Theme Deep Dive two-key lookup —
+# sorted-index .loc instead of ANDing two full-length boolean masks.
+@st.cache_resource(hash_funcs={pd.DataFrame: id})
+def theme_version_index(frame):
+    return frame.set_index(["theme_label", "RC_ver"]).sort_index()
+
+# Theme-indexed view of the signal table: Trend Analysis selections become
+# sorted-index slices instead of an isin scan per rerun.
+@st.cache_resource(hash_funcs={pd.DataFrame: id})
+def signal_by_theme(frame):
+    return frame.set_index("theme").sort_index()
+
+# Stable option lists, computed once instead of a unique+sort per rerun.
+@st.cache_data(hash_funcs={pd.DataFrame: id})
+def unique_themes(frame, column):
+    return sorted(frame[column].dropna().unique().tolist())
+
+# theme -> Is_Persistent, built once — O(1) lookup instead of a boolean
+# mask over the persistence frame per interaction.
+@st.cache_resource(hash_funcs={pd.DataFrame: id})
+def persistence_map(frame):
+    return {r.theme: bool(r.Is_Persistent) for r in frame.itertuples()}
+
+# Star-rating histogram via bincount on the raw int codes — a single C pass
+# with no hash table, and the 1–5 axis is always complete (value_counts
+# dropped ratings with zero reviews).
+def rating_histogram(scores):
+    counts = np.bincount(scores.to_numpy(dtype=np.int64), minlength=6)[1:6]
+    return pd.DataFrame({"Rating": np.arange(1, 6), "Count": counts})
+
+# Severity icon by rating, indexed by the 1-5 score — a branchless table
+# lookup instead of nested comparisons.
+RATING_ICONS = np.array(["", "[LOW]", "[LOW]", "[MED]", "[HIGH]", "[HIGH]"])
+
+# Export bytes serialized once per backlog — to_csv is per-row Python string
+# formatting and was re-run on every Priority Roadmap rerun.
+@st.cache_data(hash_funcs={pd.DataFrame: id})
+def priority_csv(backlog):
+    cols = ["theme", "Priority_Score", "Reach", "Impact", "Confidence", "Effort", "Is_Persistent", "Is_Regression"]
+    return backlog[cols].to_csv(index=False).encode()
+
+# One descending sort shared by the ranking chart (reversed view), the
+# detailed table, and the CSV export.
+priority_desc = priority.sort_values("Priority_Score", ascending=False).reset_index(drop=True)
+
+# ============================
+# Cached Figure Builders
+# ============================
+# Plotly figure construction walks the input frame to build JSON traces on
+# every rerun. These builders are keyed on a content hash of their (small)
+# aggregate inputs, so unchanged charts are served from cache.
+_DF_HASH = {pd.DataFrame: lambda d: pd.util.hash_pandas_object(d, index=True).sum()}
+
+@st.cache_data(hash_funcs=_DF_HASH)
+def summary_pain_fig(summary_pain):
+    fig = px.bar(
+        summary_pain,
+        x="final_weight",
+        y="theme_label",
+        orientation="h",
+        color="final_weight",
+        color_continuous_scale="Reds"
+    )
+    fig.update_layout(
+        height=400,
+        xaxis_title="Total Weighted User Pain",
+        yaxis_title="",
+        showlegend=False
+    )
+    fig.update_coloraxes(showscale=False)
+    return fig
+
+@st.cache_data(hash_funcs=_DF_HASH)
+def rating_dist_fig(rating_dist, height=400):
+    fig = px.bar(
+        rating_dist,
+        x="Rating",
+        y="Count",
+        color="Rating",
+        color_continuous_scale="RdYlGn"
+    )
+    fig.update_layout(height=height, showlegend=False)
+    fig.update_coloraxes(showscale=False)
+    return fig
+
+@st.cache_data(hash_funcs=_DF_HASH)
+def health_pain_fig(health_pain, selected_version):
+    fig = px.bar(
+        health_pain,
+        x="theme_label",
+        y="final_weight",
+        color="percentage",
+        color_continuous_scale="Viridis",
+        text=[f"{p:.1f}%" for p in health_pain["percentage"]]  # list comp beats .apply for plain formatting
+    )
+    fig.update_layout(
+        title=f"Release Health — Version {selected_version}",
+        xaxis_tickangle=-45,
+        height=450,
+        xaxis_title="Product Area",
+        yaxis_title="Total Weighted User Pain"
+    )
+    fig.update_traces(textposition="outside")
+    fig.update_coloraxes(showscale=False)
+    return fig
+
+@st.cache_data(hash_funcs=_DF_HASH)
+def priority_rank_fig(priority_sorted):
+    fig = px.bar(
+        priority_sorted,
+        x="Priority_Score",
+        y="theme",
+        orientation="h",
+        color="Effort",
+        color_continuous_scale="RdYlGn_r",
+        hover_data=["Reach", "Impact", "Confidence", "Is_Persistent", "Is_Regression"]
+    )
+    fig.update_layout(
+        height=400,
+        xaxis_title="Priority Score",
+        yaxis_title=""
+    )
+    return fig
+
+@st.cache_data(hash_funcs=_DF_HASH)
+def effort_pie_fig(effort_dist):
+    fig = px.pie(
+        effort_dist,
+        values="Count",
+        names="Effort",
+        color="Effort",
+        color_discrete_sequence=px.colors.sequential.RdBu
+    )
+    fig.update_layout(height=300)
+    return fig
+
+# One faceted figure for the three trend metrics — a single Plotly build
+# and one websocket payload instead of three separate line charts.
+_TREND_METRICS = ["Normalized_Signal", "Review_Count", "Avg_Rating"]
+_TREND_TITLES = {"Normalized_Signal": "Normalized Signal", "Review_Count": "Review Count", "Avg_Rating": "Average Rating"}
+
+@st.cache_data(hash_funcs=_DF_HASH)
+def trend_facet_fig(trend_data):
+    long = trend_data.melt(
+        id_vars=["RC_ver", "theme"], value_vars=_TREND_METRICS, var_name="metric", value_name="value"
+    )
+    fig = px.line(
+        long,
+        x="RC_ver",
+        y="value",
+        color="theme",
+        facet_col="metric",
+        facet_col_wrap=2,
+        markers=True,
+        category_orders={"metric": _TREND_METRICS},
+    )
+    # Metrics live on different scales; unlink the shared y axes.
+    fig.update_yaxes(matches=None, showticklabels=True)
+    fig.for_each_annotation(lambda a: a.update(text=_TREND_TITLES[a.text.split("=")[-1]]))
+    fig.update_layout(height=700, xaxis_tickangle=-45)
+    fig.update_xaxes(title_text="App Version", tickangle=-45)
+    return fig
+
+@st.cache_data(hash_funcs=_DF_HASH)
+def delta_bar_fig(delta_data):
+    fig = px.bar(
+        delta_data,
+        x="RC_ver",
+        y="Delta",
+        color="theme",
+        barmode="group"
+    )
+    fig.update_layout(
+        height=350,
+        xaxis_tickangle=-45,
+        xaxis_title="App Version",
+        yaxis_title="Signal Change"
+    )
+    fig.add_hline(y=0, line_dash="dash", line_color="gray")
+    return fig
 
 # ============================
 # Sidebar Navigation
@@ -209,9 +478,9 @@ if page == "Home":
     # Key metrics row
     col1, col2, col3, col4 = st.columns(4)
     
-    latest_version = sorted(df["RC_ver"].dropna().unique())[-1]
-    latest_reviews = len(df[df["RC_ver"] == latest_version])
-    avg_rating = df[df["RC_ver"] == latest_version]["score"].mean()
+    latest_version = df["RC_ver"].cat.categories[-1]
+    latest_reviews = len(version_groups[latest_version])
+    avg_rating = version_groups[latest_version]["score"].mean()
     persistent_issues = persistence[persistence["Is_Persistent"] == True].shape[0]
     
     with col1:
@@ -249,7 +518,7 @@ if page == "Home":
     
     with col1:
         st.subheader("Reviews by Version")
-        version_counts = df.groupby("RC_ver").size().reset_index(name="count")
+        version_counts = df.groupby("RC_ver", observed=True).size().reset_index(name="count")
         version_counts = version_counts.sort_values("RC_ver")
         
         fig = px.bar(
@@ -271,7 +540,7 @@ if page == "Home":
     
     with col2:
         st.subheader("Pain Distribution by Theme")
-        theme_pain = df.groupby("theme_label")["final_weight"].sum().reset_index()
+        theme_pain = df.groupby("theme_label", observed=True)["final_weight"].sum().reset_index()
         theme_pain = theme_pain.sort_values("final_weight", ascending=True)
         
         fig = px.pie(
@@ -636,9 +905,17 @@ elif page == "Methodology":
 elif page == "Executive Summary":
     st.title("Executive Summary")
     
-    latest_version = sorted(df["RC_ver"].dropna().unique())[-1]
-    latest_df = df[df["RC_ver"] == latest_version]
-    
+    latest_version = df["RC_ver"].cat.categories[-1]
+    latest_df = version_groups[latest_version]
+
+    # Built once here: feeds the Top Pain Area metric, the pain chart,
+    # and the Key Insights block below.
+    summary_pain = (
+        pain_by_theme(df, latest_version)
+        .sort_values(ascending=True)
+        .reset_index()
+    )
+
     st.markdown(f"### Release: **{latest_version}**")
     
     # Key metrics
@@ -657,8 +934,9 @@ elif page == "Executive Summary":
         st.metric("Total Pain Score", f"{total_pain:.0f}")
     
     with col4:
-        top_theme = latest_df.groupby("theme_label")["final_weight"].sum().idxmax()
-        st.metric("Top Pain Area", top_theme[:15] + "..." if len(top_theme) > 15 else top_theme)
+        top_theme = summary_pain.iloc[-1]["theme_label"]  # sorted ascending, so last row is the max
+        top_theme_label = top_theme[:15] + "..." if len(top_theme) > 15 else top_theme
+        st.metric("Top Pain Area", top_theme_label)
     
     st.markdown("---")
     
@@ -666,49 +944,13 @@ elif page == "Executive Summary":
     
     with col1:
         st.subheader("User Pain by Product Area")
-        
-        summary_pain = (
-            latest_df
-            .groupby("theme_label")["final_weight"]
-            .sum()
-            .sort_values(ascending=True)
-            .reset_index()
-        )
-        
-        fig = px.bar(
-            summary_pain,
-            x="final_weight",
-            y="theme_label",
-            orientation="h",
-            color="final_weight",
-            color_continuous_scale="Reds"
-        )
-        
-        fig.update_layout(
-            height=400,
-            xaxis_title="Total Weighted User Pain",
-            yaxis_title="",
-            showlegend=False
-        )
-        fig.update_coloraxes(showscale=False)
-        st.plotly_chart(fig, use_container_width=True)
+
+        st.plotly_chart(summary_pain_fig(summary_pain), use_container_width=True)
     
     with col2:
         st.subheader("Rating Distribution")
         
-        rating_dist = latest_df["score"].value_counts().sort_index().reset_index()
-        rating_dist.columns = ["Rating", "Count"]
-        
-        fig = px.bar(
-            rating_dist,
-            x="Rating",
-            y="Count",
-            color="Rating",
-            color_continuous_scale="RdYlGn"
-        )
-        fig.update_layout(height=400, showlegend=False)
-        fig.update_coloraxes(showscale=False)
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(rating_dist_fig(rating_histogram(latest_df["score"])), use_container_width=True)
     
     # Insights box
     st.markdown("---")
@@ -749,7 +991,7 @@ elif page == "Release Health":
     Uses weighted user feedback (severity × validation).
     """)
     
-    versions = sorted(df["RC_ver"].dropna().unique(), reverse=True)
+    versions = list(df["RC_ver"].cat.categories)[::-1]
     
     col1, col2 = st.columns([1, 3])
     
@@ -761,7 +1003,7 @@ elif page == "Release Health":
         )
         
         # Version stats
-        version_df = df[df["RC_ver"] == selected_version]
+        version_df = version_groups[selected_version]
         st.markdown("---")
         st.markdown("**Version Stats:**")
         st.metric("Reviews", len(version_df))
@@ -770,35 +1012,16 @@ elif page == "Release Health":
     
     with col2:
         health_pain = (
-            version_df
-            .groupby("theme_label")["final_weight"]
-            .sum()
+            pain_by_theme(df, selected_version)
             .sort_values(ascending=False)
             .reset_index()
         )
         
-        # Add percentage
-        health_pain["percentage"] = 100 * health_pain["final_weight"] / health_pain["final_weight"].sum()
-        
-        fig = px.bar(
-            health_pain,
-            x="theme_label",
-            y="final_weight",
-            color="percentage",
-            color_continuous_scale="Viridis",
-            text=health_pain["percentage"].apply(lambda x: f"{x:.1f}%")
-        )
+        # Add percentage — sum once, scale the array in one vectorized op
+        total_pain = health_pain["final_weight"].sum()
+        health_pain["percentage"] = health_pain["final_weight"].to_numpy() * (100.0 / total_pain)
         
-        fig.update_layout(
-            title=f"Release Health — Version {selected_version}",
-            xaxis_tickangle=-45,
-            height=450,
-            xaxis_title="Product Area",
-            yaxis_title="Total Weighted User Pain"
-        )
-        fig.update_traces(textposition="outside")
-        fig.update_coloraxes(showscale=False)
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(health_pain_fig(health_pain, selected_version), use_container_width=True)
     
     st.markdown("---")
     
@@ -812,13 +1035,12 @@ elif page == "Release Health":
         
         with col1:
             st.markdown(f"**Current: {selected_version}**")
-            current_pain = version_df.groupby("theme_label")["final_weight"].sum()
+            current_pain = pain_by_theme(df, selected_version)
             st.dataframe(current_pain.reset_index().rename(columns={"final_weight": "Pain Score"}), hide_index=True)
         
         with col2:
             st.markdown(f"**Previous: {prev_version}**")
-            prev_df = df[df["RC_ver"] == prev_version]
-            prev_pain = prev_df.groupby("theme_label")["final_weight"].sum()
+            prev_pain = pain_by_theme(df, prev_version)
             st.dataframe(prev_pain.reset_index().rename(columns={"final_weight": "Pain Score"}), hide_index=True)
     
     # How to interpret (NEW)
@@ -840,23 +1062,23 @@ elif page == "Priority Roadmap":
     Convert release insights into a **ranked fix order** using a RICE-style prioritization framework.
     """)
     
-    # Summary metrics
+    # Summary metrics — one fused agg pass instead of three separate
+    # column traversals.
+    summary = priority.agg({"Is_Persistent": "sum", "Is_Regression": "sum", "Effort": "mean"})
+
     col1, col2, col3, col4 = st.columns(4)
-    
+
     with col1:
         st.metric("Total Themes", len(priority))
-    
+
     with col2:
-        persistent_count = priority["Is_Persistent"].sum()
-        st.metric("Persistent Issues", int(persistent_count))
-    
+        st.metric("Persistent Issues", int(summary["Is_Persistent"]))
+
     with col3:
-        regression_count = priority["Is_Regression"].sum()
-        st.metric("Regressions", int(regression_count))
-    
+        st.metric("Regressions", int(summary["Is_Regression"]))
+
     with col4:
-        avg_effort = priority["Effort"].mean()
-        st.metric("Avg Effort", f"{avg_effort:.1f}")
+        st.metric("Avg Effort", f"{summary['Effort']:.1f}")
     
     st.markdown("---")
     
@@ -866,56 +1088,40 @@ elif page == "Priority Roadmap":
     with col1:
         st.subheader("Priority Score Ranking")
         
-        priority_sorted = priority.sort_values("Priority_Score", ascending=True)
-        
-        fig = px.bar(
-            priority_sorted,
-            x="Priority_Score",
-            y="theme",
-            orientation="h",
-            color="Effort",
-            color_continuous_scale="RdYlGn_r",
-            hover_data=["Reach", "Impact", "Confidence", "Is_Persistent", "Is_Regression"]
-        )
+        priority_sorted = priority_desc.iloc[::-1]  # ascending view, no re-sort or copy
         
-        fig.update_layout(
-            height=400,
-            xaxis_title="Priority Score",
-            yaxis_title=""
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(priority_rank_fig(priority_sorted), use_container_width=True)
     
     with col2:
         st.subheader("Effort Distribution")
         
-        effort_dist = priority.groupby("Effort").size().reset_index(name="Count")
-        
-        fig = px.pie(
-            effort_dist,
-            values="Count",
-            names="Effort",
-            color="Effort",
-            color_discrete_sequence=px.colors.sequential.RdBu
-        )
-        fig.update_layout(height=300)
-        st.plotly_chart(fig, use_container_width=True)
+        # bincount on the 1-5 integer domain — no hash-table groupby for a
+        # five-bucket histogram. Zero buckets are dropped for parity with
+        # groupby, which only emits observed efforts.
+        counts = np.bincount(priority["Effort"].to_numpy(dtype=np.int64), minlength=6)[1:6]
+        effort_dist = pd.DataFrame({"Effort": np.arange(1, 6), "Count": counts})
+        effort_dist = effort_dist[effort_dist["Count"] > 0]
+
+        st.plotly_chart(effort_pie_fig(effort_dist), use_container_width=True)
     
     st.markdown("---")
     
     # Detailed table
     st.subheader("Detailed Priority Backlog")
     
-    display_priority = priority.copy()
-    display_priority["Priority_Score"] = display_priority["Priority_Score"].apply(lambda x: f"{x:.4f}")
-    display_priority["Reach"] = display_priority["Reach"].apply(lambda x: f"{x:.2%}")
-    display_priority["Impact"] = display_priority["Impact"].apply(lambda x: f"{x:.2f}")
-    display_priority["Confidence"] = display_priority["Confidence"].apply(lambda x: f"{x:.2%}")
-    
+    # Formatting happens client-side via column_config — no frame copy and
+    # no per-cell Python .apply lambdas on every rerun, and the columns stay
+    # numeric so the built-in column sorting works.
     st.dataframe(
-        display_priority[["theme", "Priority_Score", "Reach", "Impact", "Confidence", "Effort", "Is_Persistent", "Is_Regression"]]
-        .sort_values("Priority_Score", ascending=False),
+        priority_desc[["theme", "Priority_Score", "Reach", "Impact", "Confidence", "Effort", "Is_Persistent", "Is_Regression"]],
         use_container_width=True,
-        hide_index=True
+        hide_index=True,
+        column_config={
+            "Priority_Score": st.column_config.NumberColumn(format="%.4f"),
+            "Reach": st.column_config.NumberColumn(format="percent"),
+            "Impact": st.column_config.NumberColumn(format="%.2f"),
+            "Confidence": st.column_config.NumberColumn(format="percent"),
+        },
     )
     
     # Export functionality (NEW)
@@ -928,14 +1134,14 @@ elif page == "Priority Roadmap":
         st.markdown("Download the priority backlog as CSV to import into Jira, Asana, or other tools.")
     
     with col2:
-        export_df = priority[["theme", "Priority_Score", "Reach", "Impact", "Confidence", "Effort", "Is_Persistent", "Is_Regression"]].copy()
-        export_df = export_df.sort_values("Priority_Score", ascending=False)
-        
-        csv = export_df.to_csv(index=False)
+        # Date stamp fixed once per session instead of a datetime.now() +
+        # strftime on every rerun of the page.
+        if "dl_date" not in st.session_state:
+            st.session_state.dl_date = datetime.now().strftime("%Y%m%d")
         st.download_button(
             label="Download CSV",
-            data=csv,
-            file_name=f"priority_backlog_{datetime.now().strftime('%Y%m%d')}.csv",
+            data=priority_csv(priority_desc),
+            file_name=f"priority_backlog_{st.session_state.dl_date}.csv",
             mime="text/csv"
         )
     
@@ -971,7 +1177,7 @@ elif page == "Trend Analysis":
     st.markdown("Track **theme signals across releases** to identify patterns and regressions.")
     
     # Theme selector
-    themes = sorted(version_signal["theme"].unique())
+    themes = unique_themes(version_signal, "theme")
     selected_themes = st.multiselect(
         "Select Themes to Compare",
         themes,
@@ -980,66 +1186,12 @@ elif page == "Trend Analysis":
     
     if selected_themes:
         # Filter data
-        trend_data = version_signal[version_signal["theme"].isin(selected_themes)]
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader("Normalized Signal Over Time")
-            
-            fig = px.line(
-                trend_data,
-                x="RC_ver",
-                y="Normalized_Signal",
-                color="theme",
-                markers=True
-            )
-            fig.update_layout(
-                height=400,
-                xaxis_tickangle=-45,
-                xaxis_title="App Version",
-                yaxis_title="Normalized Signal"
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            st.subheader("Review Count Trend")
-            
-            fig = px.line(
-                trend_data,
-                x="RC_ver",
-                y="Review_Count",
-                color="theme",
-                markers=True
-            )
-            fig.update_layout(
-                height=400,
-                xaxis_tickangle=-45,
-                xaxis_title="App Version",
-                yaxis_title="Review Count"
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        
-        st.markdown("---")
-        
-        # Average rating trend
-        st.subheader("Average Rating Trend by Theme")
-        
-        fig = px.line(
-            trend_data,
-            x="RC_ver",
-            y="Avg_Rating",
-            color="theme",
-            markers=True
-        )
-        fig.update_layout(
-            height=350,
-            xaxis_tickangle=-45,
-            xaxis_title="App Version",
-            yaxis_title="Average Rating"
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        trend_data = signal_by_theme(version_signal).loc[selected_themes].reset_index()
         
+        st.subheader("Theme Trends Across Releases")
+
+        st.plotly_chart(trend_facet_fig(trend_data), use_container_width=True)
+
         # Delta analysis
         st.markdown("---")
         st.subheader("Signal Delta (Version over Version)")
@@ -1047,21 +1199,7 @@ elif page == "Trend Analysis":
         delta_data = trend_data[trend_data["Delta"].notna()]
         
         if not delta_data.empty:
-            fig = px.bar(
-                delta_data,
-                x="RC_ver",
-                y="Delta",
-                color="theme",
-                barmode="group"
-            )
-            fig.update_layout(
-                height=350,
-                xaxis_tickangle=-45,
-                xaxis_title="App Version",
-                yaxis_title="Signal Change"
-            )
-            fig.add_hline(y=0, line_dash="dash", line_color="gray")
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(delta_bar_fig(delta_data), use_container_width=True)
             
             st.caption("Positive delta = worsening signal | Negative delta = improving")
         
@@ -1089,8 +1227,8 @@ elif page == "Theme Deep Dive":
     
     col1, col2 = st.columns(2)
     
-    THEMES = sorted(df["theme_label"].dropna().unique())
-    VERSIONS = sorted(df["RC_ver"].dropna().unique(), reverse=True)
+    THEMES = sorted(df["theme_label"].cat.categories)  # categorical metadata, no scan
+    VERSIONS = list(df["RC_ver"].cat.categories)[::-1]
     
     with col1:
         selected_theme = st.selectbox("Select Theme", THEMES)
@@ -1098,30 +1236,37 @@ elif page == "Theme Deep Dive":
     with col2:
         selected_version = st.selectbox("Select Version", VERSIONS)
     
-    # Filter data
-    deep_dive = df[
-        (df["theme_label"] == selected_theme) &
-        (df["RC_ver"] == selected_version)
-    ].sort_values("final_weight", ascending=False)
+    # Indexed lookup instead of scanning the frame with two boolean masks
+    df_idx = theme_version_index(df)
+    group_key = (selected_theme, selected_version)
+    if group_key in df_idx.index:
+        deep_dive = df_idx.loc[[group_key]].sort_values("final_weight", ascending=False)
+    else:
+        deep_dive = df_idx.iloc[0:0]
     
     st.markdown("---")
     
-    # Stats for this selection
+    # Stats for this selection — one fused pass over the two numeric
+    # columns instead of separate mean and sum scans; skipped entirely for
+    # an empty (theme, version) combination.
+    n_reviews = len(deep_dive)
+    if n_reviews:
+        stats = deep_dive[["score", "final_weight"]].agg({"score": "mean", "final_weight": "sum"})
+
     col1, col2, col3, col4 = st.columns(4)
-    
+
     with col1:
-        st.metric("Total Reviews", len(deep_dive))
-    
+        st.metric("Total Reviews", n_reviews)
+
     with col2:
-        st.metric("Avg Rating", f"{deep_dive['score'].mean():.2f}" if len(deep_dive) > 0 else "N/A")
-    
+        st.metric("Avg Rating", f"{stats['score']:.2f}" if n_reviews else "N/A")
+
     with col3:
-        st.metric("Total Pain", f"{deep_dive['final_weight'].sum():.1f}")
-    
+        st.metric("Total Pain", f"{stats['final_weight']:.1f}" if n_reviews else "0.0")
+
     with col4:
         # Check persistence
-        is_persistent = persistence[persistence["theme"] == selected_theme]["Is_Persistent"].values
-        st.metric("Persistent?", "Yes" if len(is_persistent) > 0 and is_persistent[0] else "No")
+        st.metric("Persistent?", "Yes" if persistence_map(persistence).get(selected_theme, False) else "No")
     
     st.markdown("---")
     
@@ -1139,23 +1284,20 @@ elif page == "Theme Deep Dive":
     
     st.subheader(f"Top {num_reviews} High-Impact Reviews")
     
-    if len(deep_dive) > 0:
-        for idx, row in deep_dive.head(num_reviews).iterrows():
-            rating = int(row["score"])
-            weight = row["final_weight"]
-            
-            # Color-code by rating
-            if rating <= 2:
-                icon = "[LOW]"
-            elif rating == 3:
-                icon = "[MED]"
-            else:
-                icon = "[HIGH]"
-            
+    if n_reviews:
+        # Column arrays instead of iterrows (which boxes every row into a
+        # Series); icons come from one table lookup by rating.
+        top = deep_dive.head(num_reviews)
+        scores = top["score"].to_numpy()
+        weights = top["final_weight"].to_numpy()
+        contents = top["content"].to_numpy()
+        icons = RATING_ICONS[scores.astype(np.int64)]
+
+        for icon, rating, weight, content in zip(icons, scores, weights, contents):
             with st.expander(f"{icon} Rating: {rating}/5 — Pain Weight: {weight:.2f}"):
                 st.markdown(f"**Review:**")
-                st.write(row["content"])
-                st.markdown(f"**Score:** {row['score']} | **Weight:** {weight:.2f}")
+                st.write(content)
+                st.markdown(f"**Score:** {rating} | **Weight:** {weight:.2f}")
     else:
         st.info("No reviews found for this combination.")
     
@@ -1164,17 +1306,5 @@ elif page == "Theme Deep Dive":
     # Word cloud or rating distribution
     st.subheader("Rating Distribution for Selection")
     
-    if len(deep_dive) > 0:
-        rating_counts = deep_dive["score"].value_counts().sort_index().reset_index()
-        rating_counts.columns = ["Rating", "Count"]
-        
-        fig = px.bar(
-            rating_counts,
-            x="Rating",
-            y="Count",
-            color="Rating",
-            color_continuous_scale="RdYlGn"
-        )
-        fig.update_layout(height=300, showlegend=False)
-        fig.update_coloraxes(showscale=False)
-        st.plotly_chart(fig, use_container_width=True)
+    if n_reviews:
+        st.plotly_chart(rating_dist_fig(rating_histogram(deep_dive["score"]), height=300), use_container_width=True)
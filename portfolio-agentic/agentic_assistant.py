@@ -6,15 +6,28 @@
 # ============================
 
 import os
+import re
 import json
+from concurrent.futures import ThreadPoolExecutor
 
+import pandas as pd
+
+import importlib.util
+
+# Availability check without paying the import cost at module load; the
+# actual import is deferred until the first chat turn (see stream_agent).
+OPENAI_AVAILABLE = importlib.util.find_spec("openai") is not None
+
+# orjson serializes list-of-dict payloads several times faster than stdlib
+# json and understands NumPy scalars natively; fall back if not installed.
 try:
-    from openai import OpenAI
-    from openai import RateLimitError, APIError, APIConnectionError
-    OPENAI_AVAILABLE = True
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
 except ImportError:
-    OPENAI_AVAILABLE = False
-    RateLimitError = APIError = APIConnectionError = Exception  # no-op if openai not installed
+    def _dumps(obj) -> str:
+        return json.dumps(obj)
 
 
 TOOLS_OPENAI = [
@@ -88,6 +101,32 @@ You have access to tools that query:
 Use the tools as needed to answer the user's question. After calling tools, summarize the results in clear, actionable language. If the user asks "why" something is prioritized, use both the backlog and sample reviews to explain. Always cite specific numbers or themes when relevant. If no tool is needed (e.g. general methodology question), answer from your knowledge."""
 
 
+_PRIORITY_COLS = ["theme", "Priority_Score", "Reach", "Impact", "Confidence", "Effort", "Is_Regression", "Is_Persistent"]
+
+# Theme list per review frame, keyed by id() — the frames come from
+# st.cache_resource so the same objects live for the whole process.
+_THEMES_CACHE = {}
+
+
+def _theme_names(reviews) -> list:
+    key = id(reviews)
+    if key not in _THEMES_CACHE:
+        _THEMES_CACHE[key] = [str(t) for t in reviews["theme_label"].dropna().unique()]
+    return _THEMES_CACHE[key]
+
+
+# Memoized JSON for the two argument-less tools — their inputs are static
+# frames loaded once per process, and the model re-requests them often.
+_STATIC_JSON_CACHE = {}
+
+
+def _static_json(tool_name: str, frame, build) -> str:
+    key = (tool_name, id(frame))
+    if key not in _STATIC_JSON_CACHE:
+        _STATIC_JSON_CACHE[key] = build()
+    return _STATIC_JSON_CACHE[key]
+
+
 def _run_tool(name: str, arguments: dict, ctx: dict) -> str:
     """Execute a tool by name with given arguments; ctx holds dataframes."""
     reviews = ctx.get("reviews")
@@ -97,77 +136,107 @@ def _run_tool(name: str, arguments: dict, ctx: dict) -> str:
 
     if name == "get_priority_backlog":
         top_n = int(arguments.get("top_n", 10))
-        df = priority.sort_values("Priority_Score", ascending=False).head(top_n)
-        rows = df[["theme", "Priority_Score", "Reach", "Impact", "Confidence", "Effort", "Is_Regression", "Is_Persistent"]].to_dict("records")
-        return json.dumps(rows, indent=2)
+        # priority arrives pre-sorted by Priority_Score descending (load_data),
+        # so the top N is a plain head slice.
+        rows = priority[_PRIORITY_COLS].head(top_n).to_dict("records")
+        return _dumps(rows)
 
     if name == "get_theme_reviews":
         theme = arguments.get("theme", "").strip()
         version = arguments.get("version")
         limit = int(arguments.get("limit", 5))
         if reviews is None:
-            return json.dumps({"error": "No review data", "available_themes": []})
-        themes_list = reviews["theme_label"].dropna().unique().tolist()
-        if theme not in [str(t) for t in themes_list]:
-            for t in themes_list:
-                if theme.lower() in str(t).lower():
-                    theme = str(t)
-                    break
-        sub = reviews[reviews["theme_label"].astype(str) == theme]
+            return _dumps({"error": "No review data", "available_themes": []})
+        themes_list = _theme_names(reviews)
+        if theme not in themes_list:
+            # Vectorized case-insensitive substring match — one C-level pass
+            # over the theme names instead of a per-element Python loop.
+            s = pd.Series(themes_list, dtype="string")
+            hit = s[s.str.contains(re.escape(theme), case=False, na=False)]
+            if len(hit):
+                theme = hit.iloc[0]
+        reviews_by_theme = ctx.get("reviews_by_theme")
+        if reviews_by_theme is not None:
+            # Pre-grouped and pain-sorted at load time — O(1) dict lookup.
+            sub = reviews_by_theme.get(theme, reviews.iloc[0:0])
+        else:
+            sub = reviews[reviews["theme_label"] == theme].sort_values("final_weight", ascending=False)
         if sub.empty:
-            return json.dumps({"error": f"No data for theme '{theme}'", "available_themes": [str(t) for t in themes_list]})
+            return _dumps({"error": f"No data for theme '{theme}'", "available_themes": themes_list})
         if version:
-            sub = sub[sub["RC_ver"].astype(str) == str(version)]
-        sub = sub.nlargest(limit, "final_weight")
-        out = [{"content": r["content"], "score": float(r["score"]), "final_weight": float(r["final_weight"])} for _, r in sub.iterrows()]
-        return json.dumps(out, indent=2)
+            sub = sub[sub["RC_ver"] == str(version)]
+        sub = sub.head(limit)
+        # Single to_numpy pull instead of iterrows — no per-row Series objects.
+        arr = sub[["content", "score", "final_weight"]].to_numpy()
+        out = [{"content": str(c)[:500], "score": float(s), "final_weight": float(w)} for c, s, w in arr]
+        return _dumps(out)
 
     if name == "get_regression_themes":
         if version_signal is None:
-            return json.dumps([])
-        reg = version_signal[version_signal["Is_Regression"] == True]
-        latest = version_signal["RC_ver"].max()
-        reg = reg[reg["RC_ver"] == latest][["theme", "RC_ver", "Normalized_Signal", "Delta"]]
-        return reg.to_json(orient="records", indent=2) if not reg.empty else json.dumps([])
+            return _dumps([])
+
+        def _build_regressions():
+            reg = version_signal[version_signal["Is_Regression"] == True]
+            latest = version_signal["RC_ver"].max()
+            reg = reg[reg["RC_ver"] == latest][["theme", "RC_ver", "Normalized_Signal", "Delta"]]
+            return _dumps(reg.to_dict(orient="records")) if not reg.empty else _dumps([])
+
+        return _static_json(name, version_signal, _build_regressions)
 
     if name == "get_persistence_themes":
         if persistence is None:
-            return json.dumps([])
-        pers = persistence[persistence["Is_Persistent"] == True][["theme", "Is_Persistent"]]
-        return pers.to_json(orient="records", indent=2) if not pers.empty else json.dumps([])
+            return _dumps([])
+
+        def _build_persistence():
+            pers = persistence[persistence["Is_Persistent"] == True][["theme", "Is_Persistent"]]
+            return _dumps(pers.to_dict(orient="records")) if not pers.empty else _dumps([])
+
+        return _static_json(name, persistence, _build_persistence)
 
     if name == "get_theme_summary_stats":
         if reviews is None:
-            return json.dumps({"error": "No review data"})
+            return _dumps({"error": "No review data"})
         version = arguments.get("version")
         df = reviews
         if version:
-            df = df[df["RC_ver"].astype(str) == str(version)]
+            df = df[df["RC_ver"] == str(version)]
         else:
             latest = df["RC_ver"].dropna().max()
             df = df[df["RC_ver"] == latest]
-        agg = df.groupby("theme_label").agg(
+        agg = df.groupby("theme_label", observed=True).agg(
             total_weight=("final_weight", "sum"),
             review_count=("review_id", "count"),
             avg_rating=("score", "mean"),
         ).reset_index()
         agg["pain_share_pct"] = (100 * agg["total_weight"] / agg["total_weight"].sum()).round(2)
-        return agg.to_json(orient="records", indent=2)
+        return _dumps(agg.to_dict(orient="records"))
 
-    return json.dumps({"error": f"Unknown tool: {name}"})
+    return _dumps({"error": f"Unknown tool: {name}"})
 
 
-def run_agent(user_message: str, context: dict, api_key: str = None) -> str:
+def _parse_args(raw: str) -> dict:
+    try:
+        return json.loads(raw or "{}")
+    except json.JSONDecodeError:
+        return {}
+
+
+def stream_agent(user_message: str, context: dict, api_key: str = None):
     """
-    Run the agentic loop: LLM can call tools; we execute and feed back until we get a final answer.
+    Run the agentic loop with streaming: yields answer text as it arrives, so the
+    UI can paint tokens immediately (st.write_stream) instead of blocking on the
+    full round-trip. Tool-call turns are executed between streamed responses.
     context = {"reviews": df, "priority": df, "persistence": df, "version_signal": df}
     """
     api_key = api_key or os.environ.get("OPENAI_API_KEY")
     if not OPENAI_AVAILABLE or not api_key:
-        return (
+        yield (
             "**Agentic AI is not configured.** Set `OPENAI_API_KEY` in your environment and install `openai` to use the assistant. "
             "This dashboard uses an LLM with **tool-calling**: it decides which data to fetch (priority backlog, theme reviews, regressions, etc.) and then answers from that data."
         )
+        return
+
+    from openai import OpenAI, RateLimitError, APIError, APIConnectionError
 
     client = OpenAI(api_key=api_key)
     messages = [
@@ -177,40 +246,74 @@ def run_agent(user_message: str, context: dict, api_key: str = None) -> str:
     max_turns = 8
     try:
         for _ in range(max_turns):
-            response = client.chat.completions.create(
+            stream = client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=messages,
                 tools=TOOLS_OPENAI,
                 tool_choice="auto",
+                stream=True,
             )
-            choice = response.choices[0]
-            if choice.finish_reason == "stop":
-                return choice.message.content or ""
-            if choice.finish_reason == "tool_calls" and choice.message.tool_calls:
-                for tc in choice.message.tool_calls:
-                    name = tc.function.name
-                    try:
-                        args = json.loads(tc.function.arguments or "{}")
-                    except json.JSONDecodeError:
-                        args = {}
-                    result = _run_tool(name, args, context)
-                    messages.append(choice.message)
-                    messages.append(
-                        {
-                            "role": "tool",
-                            "tool_call_id": tc.id,
-                            "content": result,
-                        }
-                    )
+            content_parts = []
+            pending_calls = {}  # stream index -> accumulated id/name/argument fragments
+            finish_reason = None
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                choice = chunk.choices[0]
+                delta = choice.delta
+                if delta.content:
+                    content_parts.append(delta.content)
+                    yield delta.content
+                if delta.tool_calls:
+                    for tc in delta.tool_calls:
+                        slot = pending_calls.setdefault(tc.index, {"id": "", "name": "", "arguments": []})
+                        if tc.id:
+                            slot["id"] = tc.id
+                        if tc.function and tc.function.name:
+                            slot["name"] = tc.function.name
+                        if tc.function and tc.function.arguments:
+                            slot["arguments"].append(tc.function.arguments)
+                if choice.finish_reason:
+                    finish_reason = choice.finish_reason
+            if finish_reason == "tool_calls" and pending_calls:
+                calls = [
+                    {
+                        "id": slot["id"],
+                        "type": "function",
+                        "function": {"name": slot["name"], "arguments": "".join(slot["arguments"]) or "{}"},
+                    }
+                    for _, slot in sorted(pending_calls.items())
+                ]
+                messages.append({"role": "assistant", "content": "".join(content_parts) or None, "tool_calls": calls})
+                # Tool calls are independent pandas queries; run them in
+                # parallel so a multi-tool turn costs max(tool) not sum(tool).
+                with ThreadPoolExecutor(max_workers=len(calls)) as ex:
+                    futures = [
+                        ex.submit(_run_tool, call["function"]["name"], _parse_args(call["function"]["arguments"]), context)
+                        for call in calls
+                    ]
+                    for call, fut in zip(calls, futures):
+                        messages.append(
+                            {
+                                "role": "tool",
+                                "tool_call_id": call["id"],
+                                "content": fut.result(),
+                            }
+                        )
                 continue
-            return choice.message.content or ""
-        return "I hit the turn limit. Please try a shorter or more focused question."
+            return
+        yield "I hit the turn limit. Please try a shorter or more focused question."
     except RateLimitError:
-        return (
+        yield (
             "**OpenAI rate limit reached.** You're sending too many requests. "
             "Wait a minute and try again, or check your [OpenAI usage](https://platform.openai.com/usage) and plan limits."
         )
     except (APIError, APIConnectionError) as e:
-        return f"**OpenAI API error.** Please try again later. ({type(e).__name__})"
+        yield f"**OpenAI API error.** Please try again later. ({type(e).__name__})"
     except Exception as e:
-        return f"**Something went wrong.** Please try again. ({type(e).__name__})"
+        yield f"**Something went wrong.** Please try again. ({type(e).__name__})"
+
+
+def run_agent(user_message: str, context: dict, api_key: str = None) -> str:
+    """Non-streaming wrapper: run the loop to completion and return the full answer."""
+    return "".join(stream_agent(user_message, context, api_key=api_key))
@@ -9,15 +9,18 @@
 
 import os
 import sys
+from collections import deque, namedtuple
+
 import streamlit as st
+import numpy as np
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 from datetime import datetime
 
+# plotly.express is imported lazily inside the branches and cached figure
+# builders that use it — Home and Methodology (the common landing pages)
+# never pay its import cost.
+
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from agentic_assistant import run_agent
 
 st.set_page_config(
     page_title="ReleasePulse — Spotify Review Intelligence",
@@ -28,7 +31,9 @@ st.set_page_config(
 # ============================
 # Custom CSS Styling
 # ============================
-st.markdown("""
+# Built once at import as a module constant — reruns re-send the same
+# string without re-constructing it.
+_CSS = """
 <style>
     .metric-card {
         background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
@@ -135,31 +140,284 @@ st.markdown("""
     .home-card { border-radius: 12px; padding: 1.25rem 1.5rem; box-shadow: 0 2px 8px rgba(0,0,0,0.06); border: 1px solid #eee; margin: 0.5rem 0; }
     .cta-box { background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%); border-radius: 12px; padding: 1.5rem; text-align: center; border-left: 4px solid #667eea; margin-top: 1.5rem; }
 </style>
-""", unsafe_allow_html=True)
+"""
+st.markdown(_CSS, unsafe_allow_html=True)
+
+# ============================
+# Static HTML blocks
+# ============================
+# Large page fragments that never change are module constants: reruns hand
+# Streamlit the same string object instead of rebuilding it each time.
+_HOME_QUESTIONS_HTML = """
+<div style="display:grid; grid-template-columns:repeat(3,1fr); gap:10px;">
+    <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 28px 20px; border-radius: 12px; color: white; text-align: center; min-height: 140px; box-shadow: 0 4px 12px rgba(102,126,234,0.3);">
+        <p style="margin:0; font-size: 1.5rem; opacity: 0.9;">1</p>
+        <p style="margin: 0.5rem 0 0 0; font-weight: 600;">Where is user pain coming from?</p>
+    </div>
+    <div style="background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); padding: 28px 20px; border-radius: 12px; color: white; text-align: center; min-height: 140px; box-shadow: 0 4px 12px rgba(240,147,251,0.3);">
+        <p style="margin:0; font-size: 1.5rem; opacity: 0.9;">2</p>
+        <p style="margin: 0.5rem 0 0 0; font-weight: 600;">Is this a new regression or persistent debt?</p>
+    </div>
+    <div style="background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%); padding: 28px 20px; border-radius: 12px; color: white; text-align: center; min-height: 140px; box-shadow: 0 4px 12px rgba(79,172,254,0.3);">
+        <p style="margin:0; font-size: 1.5rem; opacity: 0.9;">3</p>
+        <p style="margin: 0.5rem 0 0 0; font-weight: 600;">What should we fix next?</p>
+    </div>
+</div>
+"""
+
+_HOME_BUILT_WITH_HTML = """
+<div style="display:grid; grid-template-columns:repeat(3,1fr); gap:10px;">
+    <div class="home-card">
+    <strong>NLP & clustering</strong><br>
+    <span style="color:#666; font-size:0.9rem;">sentence-transformers, weighted KMeans for theme discovery.</span>
+    </div>
+    <div class="home-card">
+    <strong>ML pipeline</strong><br>
+    <span style="color:#666; font-size:0.9rem;">Regression & persistence detection, RICE prioritization.</span>
+    </div>
+    <div class="home-card">
+    <strong>Agentic AI</strong><br>
+    <span style="color:#666; font-size:0.9rem;">LLM + tool-calling: decides which data to fetch, answers from backlog, reviews, regressions.</span>
+    </div>
+</div>
+"""
+
+_METHODOLOGY_STEPS_HTML = """
+<div style="display:grid; grid-template-columns:repeat(5,1fr); gap:10px;">
+    <div class="methodology-card" style="text-align: center;">
+    <h4>Step 1</h4>
+    <p><strong>Collect</strong></p>
+    <p style="font-size: 0.8rem;">App store reviews with scores & metadata</p>
+    </div>
+    <div class="methodology-card" style="text-align: center;">
+    <h4>Step 2</h4>
+    <p><strong>Weight</strong></p>
+    <p style="font-size: 0.8rem;">Severity × Impact × Sample Size</p>
+    </div>
+    <div class="methodology-card" style="text-align: center;">
+    <h4>Step 3</h4>
+    <p><strong>Cluster</strong></p>
+    <p style="font-size: 0.8rem;">NLP embeddings + KMeans</p>
+    </div>
+    <div class="methodology-card" style="text-align: center;">
+    <h4>Step 4</h4>
+    <p><strong>Analyze</strong></p>
+    <p style="font-size: 0.8rem;">Regression & persistence detection</p>
+    </div>
+    <div class="methodology-card" style="text-align: center;">
+    <h4>Step 5</h4>
+    <p><strong>Prioritize</strong></p>
+    <p style="font-size: 0.8rem;">RICE scoring</p>
+    </div>
+</div>
+"""
 
 # ============================
 # Load Data (paths relative to project root)
 # ============================
 _DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data")
 
-@st.cache_data
+def _read_dataset(name, columns=None, **csv_kwargs):
+    """Read data/<name>.csv through a parquet sidecar written on first run.
+
+    Parquet decodes an order of magnitude faster than CSV parsing and bakes
+    the dtypes (categoricals, int8, float32) into the file, so every cold
+    start after the first skips both parsing and type conversion. `columns`
+    restricts the load to what the app actually uses. Falls back to plain
+    CSV if the data dir is not writable (read-only deployments) or if an
+    existing sidecar cannot be read back.
+
+    The sidecar carries an ``.agentic`` infix so it never collides with the
+    root Dashboard's sidecar for the same CSV, which is written with a
+    different column set. CSV parsing uses the default C engine: the reviews
+    file has multi-line quoted embedding fields the pyarrow reader rejects.
+    """
+    csv_path = os.path.join(_DATA_DIR, f"{name}.csv")
+    pq_path = os.path.join(_DATA_DIR, f"{name}.agentic.parquet")
+    try:
+        if not os.path.exists(pq_path) or os.path.getmtime(pq_path) < os.path.getmtime(csv_path):
+            pd.read_csv(csv_path, usecols=columns, **csv_kwargs).to_parquet(pq_path)
+        return pd.read_parquet(pq_path, engine="pyarrow", columns=columns)
+    except (OSError, ValueError):
+        # pyarrow's ArrowInvalid (e.g. a sidecar missing a requested column)
+        # subclasses ValueError, so a bad sidecar degrades to the CSV path
+        # instead of crashing the app.
+        return pd.read_csv(csv_path, usecols=columns, **csv_kwargs)
+
+# Named bundle so the loader's nine results travel as one object with
+# readable field access instead of a positional 9-tuple.
+Bundle = namedtuple(
+    "Bundle",
+    "reviews priority persistence version_signal theme_agg top_reviews rating_counts_by_group reviews_by_theme persistent_set",
+)
+
+# cache_resource returns the same objects on every rerun — no pickle
+# round-trip and no per-access deep hash of the returned frames, which is
+# what cache_data would do. The frames are treated as read-only: never
+# mutate them in place — copy inside the branch if a page needs to modify
+# data. max_entries=1 because the loader has no parameters.
+@st.cache_resource(show_spinner=False, max_entries=1)
 def load_data():
-    reviews = pd.read_csv(os.path.join(_DATA_DIR, "spotify_reviews_multilabel.csv"))
-    priority = pd.read_csv(os.path.join(_DATA_DIR, "priority_backlog.csv"))
-    persistence = pd.read_csv(os.path.join(_DATA_DIR, "theme_persistence.csv"))
-    version_signal = pd.read_csv(os.path.join(_DATA_DIR, "theme_version_signal.csv"))
-    return reviews, priority, persistence, version_signal
+    # Explicit dtypes skip type inference on the one-time CSV parse and are
+    # preserved by the parquet sidecar. Low-cardinality label columns land as
+    # categoricals: int codes instead of Python strings for every filter,
+    # groupby, and unique() downstream.
+    # Everything the pages and agent tools touch; skips the embedding
+    # vectors, clean_content and the intermediate weight columns, which
+    # dominate parse time and memory but are never read.
+    reviews = _read_dataset(
+        "spotify_reviews_multilabel",
+        columns=["review_id", "content", "score", "RC_ver", "final_weight", "theme_label"],
+        dtype={"theme_label": "category", "RC_ver": "category", "score": "int8", "final_weight": "float32"},
+    )
+    priority = _read_dataset("priority_backlog")
+    # Sort once here; every consumer wants Priority_Score descending.
+    priority = priority.sort_values("Priority_Score", ascending=False).reset_index(drop=True)
+    persistence = _read_dataset("theme_persistence")
+    version_signal = _read_dataset("theme_version_signal")
+    # RC_ver is ordered in release order so min/max/sort work on the codes.
+    reviews["RC_ver"] = reviews["RC_ver"].cat.reorder_categories(
+        sorted(reviews["RC_ver"].cat.categories), ordered=True
+    )
+    # Per-(theme, version) rollups so the Deep Dive page does O(1) lookups
+    # instead of rescanning the review frame on every widget change.
+    theme_agg = (
+        reviews
+        .groupby(["theme_label", "RC_ver"], observed=True)
+        .agg(n=("review_id", "count"), avg=("score", "mean"), pain=("final_weight", "sum"))
+    )
+    top_reviews = (
+        reviews
+        .sort_values("final_weight", ascending=False)
+        .groupby(["theme_label", "RC_ver"], observed=True)
+        .head(20)
+        .set_index(["theme_label", "RC_ver"])
+        .sort_index()
+    )
+    rating_counts_by_group = reviews.groupby(["theme_label", "RC_ver", "score"], observed=True).size().rename("Count")
+    # Pre-grouped, pain-sorted reviews per theme for the AI assistant's
+    # get_theme_reviews tool — dict lookup instead of a full-frame scan.
+    reviews_by_theme = {
+        str(t): sub.sort_values("final_weight", ascending=False)
+        for t, sub in reviews.groupby("theme_label", observed=True, sort=False)
+    }
+    # Scalar flag lookups as a hash set instead of boolean frame scans.
+    persistent_set = frozenset(persistence.loc[persistence["Is_Persistent"], "theme"])
+    return Bundle(reviews, priority, persistence, version_signal, theme_agg, top_reviews, rating_counts_by_group, reviews_by_theme, persistent_set)
+
+reviews, priority, persistence, version_signal, theme_agg, top_reviews, rating_counts_by_group, reviews_by_theme, persistent_set = load_data()
+df = reviews  # read-only alias; pages never mutate the shared frame
+
+def _short(s, n=15):
+    """Truncate a label for metric display; single home for the pattern."""
+    return s if len(s) <= n else s[:n] + "…"
+
+# Per-version scalars and theme rollups, computed in one pass over the
+# review frame — the Executive Summary and Release Health pages read O(1)
+# dict entries instead of re-filtering and re-grouping on every rerun.
+@st.cache_resource(hash_funcs={pd.DataFrame: id})
+def version_aggregates(frame):
+    return {
+        v: {
+            "n": len(g),
+            "avg": g["score"].mean(),
+            "pain": g["final_weight"].sum(),
+            "by_theme": g.groupby("theme_label", observed=True, sort=False)["final_weight"].sum(),
+            "rating_dist": g["score"].value_counts(sort=False).sort_index(),
+        }
+        for v, g in frame.groupby("RC_ver", sort=False, observed=True)
+    }
+
+# Option lists are stable per data load; cache them so widget interactions
+# don't redo the dropna/unique/sort scan over the full review frame.
+@st.cache_data(hash_funcs={pd.DataFrame: lambda d: (len(d), str(d["RC_ver"].iloc[-1]))})
+def _theme_version_options(frame):
+    # Categorical metadata — no scan of the underlying rows; RC_ver categories
+    # are already ordered in release order, so newest-first is a reverse.
+    themes = sorted(frame["theme_label"].cat.categories.tolist())
+    versions = frame["RC_ver"].cat.categories.tolist()[::-1]
+    return themes, versions
+
+# Figure builders are cached on their small aggregate inputs, so unchanged
+# charts skip Plotly figure construction and JSON encoding on reruns.
+# Content-hash the aggregates instead of Streamlit's default deep hash.
+_PD_HASH = {
+    pd.DataFrame: lambda d: pd.util.hash_pandas_object(d, index=True).sum(),
+    pd.Series: lambda s: pd.util.hash_pandas_object(s, index=True).sum(),
+}
+
+@st.cache_data(hash_funcs=_PD_HASH)
+def _summary_pain_fig(summary_pain):
+    import plotly.graph_objects as go
+
+    # Hand go.Bar contiguous NumPy arrays — Plotly base64-encodes typed
+    # arrays, halving the JSON payload vs. a DataFrame through px.
+    pain_arr = np.ascontiguousarray(summary_pain["final_weight"].to_numpy(dtype=np.float32))
+    fig = go.Figure(
+        go.Bar(
+            x=pain_arr,
+            y=summary_pain["theme_label"].astype(str).tolist(),
+            orientation="h",
+            marker=dict(color=pain_arr, colorscale="Reds"),
+        )
+    )
+    fig.update_layout(
+        height=400,
+        xaxis_title="Total Weighted User Pain",
+        yaxis_title="",
+        showlegend=False
+    )
+    return fig
+
+@st.cache_data(hash_funcs=_PD_HASH)
+def _rating_dist_fig(rating_counts, height=400):
+    import plotly.graph_objects as go
+
+    ratings = rating_counts.index.to_numpy(dtype=np.int8)
+    counts = np.ascontiguousarray(rating_counts.to_numpy(dtype=np.int32))
+    fig = go.Figure(go.Bar(x=ratings, y=counts, marker=dict(color=ratings, colorscale="RdYlGn")))
+    fig.update_layout(height=height, showlegend=False, xaxis_title="Rating", yaxis_title="Count")
+    return fig
 
-reviews, priority, persistence, version_signal = load_data()
-df = reviews.copy()
+@st.cache_data(hash_funcs=_PD_HASH)
+def _health_pain_fig(pain_by_theme, selected_version):
+    import plotly.graph_objects as go
 
+    # Straight from the precomputed by-theme series to typed arrays — no
+    # sort/reset_index DataFrame round-trip just to hand Plotly two columns.
+    s = pain_by_theme.sort_values(ascending=False)
+    vals = np.ascontiguousarray(s.to_numpy(dtype=np.float32))
+    pct = vals * (100.0 / vals.sum())
+    fig = go.Figure(
+        go.Bar(
+            x=s.index.astype(str).tolist(),
+            y=vals,
+            marker=dict(color=pct, colorscale="Viridis"),
+            text=[f"{p:.1f}%" for p in pct],  # list comp beats .apply for plain formatting
+            textposition="outside",
+        )
+    )
+    fig.update_layout(
+        title=f"Release Health — Version {selected_version}",
+        xaxis_tickangle=-45,
+        height=450,
+        xaxis_title="Product Area",
+        yaxis_title="Total Weighted User Pain",
+        showlegend=False,
+    )
+    return fig
+
+# Bounded history: a deque with maxlen drops the oldest turns instead of
+# growing without limit over a long session.
 if "chat_messages" not in st.session_state:
-    st.session_state.chat_messages = []
+    st.session_state.chat_messages = deque(maxlen=64)
 
 # ============================
 # Sidebar Navigation
 # ============================
-st.sidebar.image("https://upload.wikimedia.org/wikipedia/commons/thumb/8/84/Spotify_icon.svg/232px-Spotify_icon.svg.png", width=60)
+# Bundled asset — no Wikimedia round trip on cold start, no runtime
+# dependency on an external host.
+st.sidebar.image(os.path.join(_DATA_DIR, "..", "assets", "spotify_icon.svg"), width=60)
 st.sidebar.caption("**Spotify app** · User review intelligence")
 st.sidebar.title("ReleasePulse")
 st.sidebar.markdown("Feedback insights & prioritization from **Spotify** app store reviews.")
@@ -184,26 +442,47 @@ st.sidebar.caption("Ask about Spotify priorities, themes, regressions.")
 st.sidebar.markdown("**Sample questions:**")
 st.sidebar.markdown("- What should we fix first?  \n- Which themes regressed?  \n- Show me Playback Reliability reviews  \n- What are the persistent issues?")
 st.sidebar.markdown("")
-with st.sidebar.expander("**Open chat**", expanded=True):
-    for msg in st.session_state.chat_messages[-8:]:
-        with st.chat_message(msg["role"], avatar=None):
-            st.markdown(msg["content"])
-    chat_prompt = st.text_input("Ask about Spotify reviews...", key="sidebar_chat_input", placeholder="e.g. What should we fix first?")
-    if st.button("Send", key="sidebar_chat_send"):
-        if chat_prompt and chat_prompt.strip():
+# Fragment scope: sending a chat message reruns only this block — the
+# selected page's charts and markdown are untouched by a chat turn.
+@st.fragment
+def _sidebar_chat():
+    with st.expander("**Open chat**", expanded=True):
+        for msg in list(st.session_state.chat_messages)[-8:]:
+            with st.chat_message(msg["role"], avatar=None):
+                st.markdown(msg["content"])
+        # A form clears the input on submit without deleting the widget key, and
+        # the new turn renders in place — no full-script st.rerun per send.
+        with st.form("sidebar_chat_form", clear_on_submit=True):
+            chat_prompt = st.text_input("Ask about Spotify reviews...", placeholder="e.g. What should we fix first?")
+            chat_submitted = st.form_submit_button("Send")
+        if chat_submitted and chat_prompt and chat_prompt.strip():
+            # Deferred import: pulls in openai, which only needs to load once
+            # the user actually sends a chat — not on every page paint.
+            from agentic_assistant import stream_agent
+
             # Streamlit Cloud stores secrets in st.secrets; local uses OPENAI_API_KEY env var
             try:
                 api_key = st.secrets["OPENAI_API_KEY"]
             except (KeyError, AttributeError, TypeError):
                 api_key = os.environ.get("OPENAI_API_KEY")
-            ctx = {"reviews": reviews, "priority": priority, "persistence": persistence, "version_signal": version_signal}
-            with st.spinner("Thinking..."):
-                reply = run_agent(chat_prompt.strip(), ctx, api_key=api_key)
+            ctx = {
+                "reviews": reviews,
+                "priority": priority,
+                "persistence": persistence,
+                "version_signal": version_signal,
+                "reviews_by_theme": reviews_by_theme,
+            }
+            with st.chat_message("user", avatar=None):
+                st.markdown(chat_prompt.strip())
+            # Stream tokens as they arrive instead of blocking on a spinner
+            # until the full agent loop finishes.
+            with st.chat_message("assistant", avatar=None):
+                reply = st.write_stream(stream_agent(chat_prompt.strip(), ctx, api_key=api_key))
             st.session_state.chat_messages.append({"role": "user", "content": chat_prompt.strip()})
             st.session_state.chat_messages.append({"role": "assistant", "content": reply})
-            if "sidebar_chat_input" in st.session_state:
-                del st.session_state["sidebar_chat_input"]
-            st.rerun()
+
+with st.sidebar:
+    _sidebar_chat()
 st.sidebar.markdown("---")
 st.sidebar.caption("Portfolio edition — Suruthe Jayachandran")
 
@@ -230,28 +509,9 @@ if page == "Home":
     st.markdown("---")
     st.markdown("**ReleasePulse** helps Product Managers answer three core questions:")
     
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.markdown("""
-        <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 28px 20px; border-radius: 12px; color: white; text-align: center; min-height: 140px; box-shadow: 0 4px 12px rgba(102,126,234,0.3);">
-            <p style="margin:0; font-size: 1.5rem; opacity: 0.9;">1</p>
-            <p style="margin: 0.5rem 0 0 0; font-weight: 600;">Where is user pain coming from?</p>
-        </div>
-        """, unsafe_allow_html=True)
-    with col2:
-        st.markdown("""
-        <div style="background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); padding: 28px 20px; border-radius: 12px; color: white; text-align: center; min-height: 140px; box-shadow: 0 4px 12px rgba(240,147,251,0.3);">
-            <p style="margin:0; font-size: 1.5rem; opacity: 0.9;">2</p>
-            <p style="margin: 0.5rem 0 0 0; font-weight: 600;">Is this a new regression or persistent debt?</p>
-        </div>
-        """, unsafe_allow_html=True)
-    with col3:
-        st.markdown("""
-        <div style="background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%); padding: 28px 20px; border-radius: 12px; color: white; text-align: center; min-height: 140px; box-shadow: 0 4px 12px rgba(79,172,254,0.3);">
-            <p style="margin:0; font-size: 1.5rem; opacity: 0.9;">3</p>
-            <p style="margin: 0.5rem 0 0 0; font-weight: 600;">What should we fix next?</p>
-        </div>
-        """, unsafe_allow_html=True)
+    # One grid element instead of st.columns(3) + three markdown elements —
+    # a single proto message to the frontend per card cluster.
+    st.markdown(_HOME_QUESTIONS_HTML, unsafe_allow_html=True)
     
     st.markdown("---")
     st.subheader("The Problem We Solve")
@@ -287,28 +547,7 @@ if page == "Home":
     
     st.markdown("---")
     st.subheader("Built with — AI & ML")
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.markdown("""
-        <div class="home-card">
-        <strong>NLP & clustering</strong><br>
-        <span style="color:#666; font-size:0.9rem;">sentence-transformers, weighted KMeans for theme discovery.</span>
-        </div>
-        """, unsafe_allow_html=True)
-    with col2:
-        st.markdown("""
-        <div class="home-card">
-        <strong>ML pipeline</strong><br>
-        <span style="color:#666; font-size:0.9rem;">Regression & persistence detection, RICE prioritization.</span>
-        </div>
-        """, unsafe_allow_html=True)
-    with col3:
-        st.markdown("""
-        <div class="home-card">
-        <strong>Agentic AI</strong><br>
-        <span style="color:#666; font-size:0.9rem;">LLM + tool-calling: decides which data to fetch, answers from backlog, reviews, regressions.</span>
-        </div>
-        """, unsafe_allow_html=True)
+    st.markdown(_HOME_BUILT_WITH_HTML, unsafe_allow_html=True)
     
     st.markdown("""
     <div class="cta-box">
@@ -335,52 +574,8 @@ elif page == "Methodology":
     # Pipeline Overview
     st.subheader("1. Data Pipeline Overview")
     
-    col1, col2, col3, col4, col5 = st.columns(5)
-    
-    with col1:
-        st.markdown("""
-        <div class="methodology-card" style="text-align: center;">
-        <h4>Step 1</h4>
-        <p><strong>Collect</strong></p>
-        <p style="font-size: 0.8rem;">App store reviews with scores & metadata</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div class="methodology-card" style="text-align: center;">
-        <h4>Step 2</h4>
-        <p><strong>Weight</strong></p>
-        <p style="font-size: 0.8rem;">Severity × Impact × Sample Size</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown("""
-        <div class="methodology-card" style="text-align: center;">
-        <h4>Step 3</h4>
-        <p><strong>Cluster</strong></p>
-        <p style="font-size: 0.8rem;">NLP embeddings + KMeans</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col4:
-        st.markdown("""
-        <div class="methodology-card" style="text-align: center;">
-        <h4>Step 4</h4>
-        <p><strong>Analyze</strong></p>
-        <p style="font-size: 0.8rem;">Regression & persistence detection</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col5:
-        st.markdown("""
-        <div class="methodology-card" style="text-align: center;">
-        <h4>Step 5</h4>
-        <p><strong>Prioritize</strong></p>
-        <p style="font-size: 0.8rem;">RICE scoring</p>
-        </div>
-        """, unsafe_allow_html=True)
+    # One grid element instead of st.columns(5) + five markdown elements.
+    st.markdown(_METHODOLOGY_STEPS_HTML, unsafe_allow_html=True)
     
     st.markdown("---")
     
@@ -569,79 +764,41 @@ elif page == "Executive Summary":
     """, unsafe_allow_html=True)
     st.markdown("---")
     
-    latest_version = sorted(df["RC_ver"].dropna().unique())[-1]
-    latest_df = df[df["RC_ver"] == latest_version]
-    
+    latest_version = df["RC_ver"].cat.categories[-1]  # O(1): ordered categories
+    agg = version_aggregates(df)[latest_version]
+
     st.markdown(f"### Release: **{latest_version}**")
-    
+
     # Key metrics
     col1, col2, col3, col4 = st.columns(4)
-    
+
     with col1:
-        total_reviews = len(latest_df)
-        st.metric("Total Reviews", f"{total_reviews:,}")
-    
+        st.metric("Total Reviews", f"{agg['n']:,}")
+
     with col2:
-        avg_rating = latest_df["score"].mean()
-        st.metric("Average Rating", f"{avg_rating:.2f}")
-    
+        st.metric("Average Rating", f"{agg['avg']:.2f}")
+
     with col3:
-        total_pain = latest_df["final_weight"].sum()
-        st.metric("Total Pain Score", f"{total_pain:.0f}")
-    
+        st.metric("Total Pain Score", f"{agg['pain']:.0f}")
+
     with col4:
-        top_theme = latest_df.groupby("theme_label")["final_weight"].sum().idxmax()
-        st.metric("Top Pain Area", top_theme[:15] + "..." if len(top_theme) > 15 else top_theme)
-    
+        st.metric("Top Pain Area", _short(agg["by_theme"].idxmax()))
+
     st.markdown("---")
-    
+
     col1, col2 = st.columns([2, 1])
-    
+
     with col1:
         st.subheader("User Pain by Product Area")
-        
-        summary_pain = (
-            latest_df
-            .groupby("theme_label")["final_weight"]
-            .sum()
-            .sort_values(ascending=True)
-            .reset_index()
-        )
-        
-        fig = px.bar(
-            summary_pain,
-            x="final_weight",
-            y="theme_label",
-            orientation="h",
-            color="final_weight",
-            color_continuous_scale="Reds"
-        )
-        
-        fig.update_layout(
-            height=400,
-            xaxis_title="Total Weighted User Pain",
-            yaxis_title="",
-            showlegend=False
-        )
-        fig.update_coloraxes(showscale=False)
-        st.plotly_chart(fig, use_container_width=True)
-    
+
+        summary_pain = agg["by_theme"].sort_values(ascending=True).reset_index()
+
+        st.plotly_chart(_summary_pain_fig(summary_pain), use_container_width=True, config={"staticPlot": True})
+
     with col2:
         st.subheader("Rating Distribution")
-        
-        rating_dist = latest_df["score"].value_counts().sort_index().reset_index()
-        rating_dist.columns = ["Rating", "Count"]
-        
-        fig = px.bar(
-            rating_dist,
-            x="Rating",
-            y="Count",
-            color="Rating",
-            color_continuous_scale="RdYlGn"
-        )
-        fig.update_layout(height=400, showlegend=False)
-        fig.update_coloraxes(showscale=False)
-        st.plotly_chart(fig, use_container_width=True)
+
+        st.plotly_chart(_rating_dist_fig(agg["rating_dist"]), use_container_width=True, config={"staticPlot": True})
     
     # Insights box
     st.markdown("---")
@@ -656,9 +813,9 @@ elif page == "Executive Summary":
         """)
     
     with col2:
-        low_ratings = len(latest_df[latest_df["score"] <= 2])
+        low_ratings = int(agg["rating_dist"].loc[:2].sum())
         st.markdown(f"""
-        **Critical Reviews (1-2 stars):** {low_ratings} ({100*low_ratings/len(latest_df):.1f}%)  
+        **Critical Reviews (1-2 stars):** {low_ratings} ({100*low_ratings/agg['n']:.1f}%)
         - Requires immediate attention
         """)
     
@@ -682,7 +839,7 @@ elif page == "Release Health":
     Uses weighted user feedback (severity × validation).
     """)
     
-    versions = sorted(df["RC_ver"].dropna().unique(), reverse=True)
+    versions = _theme_version_options(df)[1]
     
     col1, col2 = st.columns([1, 3])
     
@@ -693,45 +850,18 @@ elif page == "Release Health":
             index=0
         )
         
-        # Version stats
-        version_df = df[df["RC_ver"] == selected_version]
+        # Version stats — precomputed rollup, no frame scan on rerun
+        agg = version_aggregates(df)[selected_version]
         st.markdown("---")
         st.markdown("**Version Stats:**")
-        st.metric("Reviews", len(version_df))
-        st.metric("Avg Rating", f"{version_df['score'].mean():.2f}")
-        st.metric("Pain Score", f"{version_df['final_weight'].sum():.0f}")
-    
+        st.metric("Reviews", agg["n"])
+        st.metric("Avg Rating", f"{agg['avg']:.2f}")
+        st.metric("Pain Score", f"{agg['pain']:.0f}")
+
     with col2:
-        health_pain = (
-            version_df
-            .groupby("theme_label")["final_weight"]
-            .sum()
-            .sort_values(ascending=False)
-            .reset_index()
-        )
-        
-        # Add percentage
-        health_pain["percentage"] = 100 * health_pain["final_weight"] / health_pain["final_weight"].sum()
-        
-        fig = px.bar(
-            health_pain,
-            x="theme_label",
-            y="final_weight",
-            color="percentage",
-            color_continuous_scale="Viridis",
-            text=health_pain["percentage"].apply(lambda x: f"{x:.1f}%")
-        )
-        
-        fig.update_layout(
-            title=f"Release Health — Version {selected_version}",
-            xaxis_tickangle=-45,
-            height=450,
-            xaxis_title="Product Area",
-            yaxis_title="Total Weighted User Pain"
-        )
-        fig.update_traces(textposition="outside")
-        fig.update_coloraxes(showscale=False)
-        st.plotly_chart(fig, use_container_width=True)
+        # Cached per (data, version): revisiting a release skips the
+        # Plotly figure construction and JSON encoding entirely.
+        st.plotly_chart(_health_pain_fig(agg["by_theme"], selected_version), use_container_width=True, config={"staticPlot": True})
     
     st.markdown("---")
     
@@ -745,13 +875,12 @@ elif page == "Release Health":
         
         with col1:
             st.markdown(f"**Current: {selected_version}**")
-            current_pain = version_df.groupby("theme_label")["final_weight"].sum()
+            current_pain = agg["by_theme"]
             st.dataframe(current_pain.reset_index().rename(columns={"final_weight": "Pain Score"}), hide_index=True)
-        
+
         with col2:
             st.markdown(f"**Previous: {prev_version}**")
-            prev_df = df[df["RC_ver"] == prev_version]
-            prev_pain = prev_df.groupby("theme_label")["final_weight"].sum()
+            prev_pain = version_aggregates(df)[prev_version]["by_theme"]
             st.dataframe(prev_pain.reset_index().rename(columns={"final_weight": "Pain Score"}), hide_index=True)
     
     # How to interpret (NEW)
@@ -767,6 +896,8 @@ elif page == "Release Health":
 # 6. PRIORITY ROADMAP
 # ============================
 elif page == "Priority Roadmap":
+    import plotly.express as px
+
     st.title("Priority Roadmap")
     
     st.markdown("""
@@ -799,7 +930,7 @@ elif page == "Priority Roadmap":
     with col1:
         st.subheader("Priority Score Ranking")
         
-        priority_sorted = priority.sort_values("Priority_Score", ascending=True)
+        priority_sorted = priority.iloc[::-1]  # pre-sorted descending; reversed view for the h-bar
         
         fig = px.bar(
             priority_sorted,
@@ -845,8 +976,7 @@ elif page == "Priority Roadmap":
     display_priority["Confidence"] = display_priority["Confidence"].apply(lambda x: f"{x:.2%}")
     
     st.dataframe(
-        display_priority[["theme", "Priority_Score", "Reach", "Impact", "Confidence", "Effort", "Is_Persistent", "Is_Regression"]]
-        .sort_values("Priority_Score", ascending=False),
+        display_priority[["theme", "Priority_Score", "Reach", "Impact", "Confidence", "Effort", "Is_Persistent", "Is_Regression"]],
         use_container_width=True,
         hide_index=True
     )
@@ -861,9 +991,8 @@ elif page == "Priority Roadmap":
         st.markdown("Download the priority backlog as CSV to import into Jira, Asana, or other tools.")
     
     with col2:
-        export_df = priority[["theme", "Priority_Score", "Reach", "Impact", "Confidence", "Effort", "Is_Persistent", "Is_Regression"]].copy()
-        export_df = export_df.sort_values("Priority_Score", ascending=False)
-        
+        export_df = priority[["theme", "Priority_Score", "Reach", "Impact", "Confidence", "Effort", "Is_Persistent", "Is_Regression"]]
+
         csv = export_df.to_csv(index=False)
         st.download_button(
             label="Download CSV",
@@ -899,6 +1028,8 @@ elif page == "Priority Roadmap":
 # 7. TREND ANALYSIS
 # ============================
 elif page == "Trend Analysis":
+    import plotly.express as px
+
     st.title("Trend Analysis")
     
     st.markdown("Track **theme signals across releases** to identify patterns and regressions.")
@@ -1022,8 +1153,7 @@ elif page == "Theme Deep Dive":
     
     col1, col2 = st.columns(2)
     
-    THEMES = sorted(df["theme_label"].dropna().unique())
-    VERSIONS = sorted(df["RC_ver"].dropna().unique(), reverse=True)
+    THEMES, VERSIONS = _theme_version_options(df)
     
     with col1:
         selected_theme = st.selectbox("Select Theme", THEMES)
@@ -1031,30 +1161,33 @@ elif page == "Theme Deep Dive":
     with col2:
         selected_version = st.selectbox("Select Version", VERSIONS)
     
-    # Filter data
-    deep_dive = df[
-        (df["theme_label"] == selected_theme) &
-        (df["RC_ver"] == selected_version)
-    ].sort_values("final_weight", ascending=False)
-    
+    # O(1) lookups against the precomputed per-(theme, version) tables —
+    # no scan of the full review frame on widget changes.
+    group_key = (selected_theme, selected_version)
+    if group_key in theme_agg.index:
+        group_stats = theme_agg.loc[group_key]
+        selection = top_reviews.loc[[group_key]]
+    else:
+        group_stats = None
+        selection = top_reviews.iloc[0:0]
+
     st.markdown("---")
-    
+
     # Stats for this selection
     col1, col2, col3, col4 = st.columns(4)
-    
+
     with col1:
-        st.metric("Total Reviews", len(deep_dive))
-    
+        st.metric("Total Reviews", int(group_stats["n"]) if group_stats is not None else 0)
+
     with col2:
-        st.metric("Avg Rating", f"{deep_dive['score'].mean():.2f}" if len(deep_dive) > 0 else "N/A")
-    
+        st.metric("Avg Rating", f"{group_stats['avg']:.2f}" if group_stats is not None else "N/A")
+
     with col3:
-        st.metric("Total Pain", f"{deep_dive['final_weight'].sum():.1f}")
+        st.metric("Total Pain", f"{group_stats['pain']:.1f}" if group_stats is not None else "0.0")
     
     with col4:
-        # Check persistence
-        is_persistent = persistence[persistence["theme"] == selected_theme]["Is_Persistent"].values
-        st.metric("Persistent?", "Yes" if len(is_persistent) > 0 and is_persistent[0] else "No")
+        # Check persistence — O(1) set membership, no frame scan
+        st.metric("Persistent?", "Yes" if selected_theme in persistent_set else "No")
     
     st.markdown("---")
     
@@ -1072,23 +1205,18 @@ elif page == "Theme Deep Dive":
     
     st.subheader(f"Top {num_reviews} High-Impact Reviews")
     
-    if len(deep_dive) > 0:
-        for idx, row in deep_dive.head(num_reviews).iterrows():
-            rating = int(row["score"])
-            weight = row["final_weight"]
-            
-            # Color-code by rating
-            if rating <= 2:
-                icon = "[LOW]"
-            elif rating == 3:
-                icon = "[MED]"
-            else:
-                icon = "[HIGH]"
-            
-            with st.expander(f"{icon} Rating: {rating}/5 — Pain Weight: {weight:.2f}"):
-                st.markdown(f"**Review:**")
-                st.write(row["content"])
-                st.markdown(f"**Score:** {row['score']} | **Weight:** {weight:.2f}")
+    if len(selection) > 0:
+        # One dataframe widget instead of up to 20 expanders — the slider no
+        # longer tears down and rebuilds dozens of components per change.
+        top = selection.head(num_reviews)
+        st.dataframe(
+            top[["score", "final_weight", "content"]].rename(
+                columns={"score": "Rating", "final_weight": "Pain Weight", "content": "Review"}
+            ),
+            use_container_width=True,
+            hide_index=True,
+            height=600,
+        )
     else:
         st.info("No reviews found for this combination.")
     
@@ -1097,17 +1225,6 @@ elif page == "Theme Deep Dive":
     # Word cloud or rating distribution
     st.subheader("Rating Distribution for Selection")
     
-    if len(deep_dive) > 0:
-        rating_counts = deep_dive["score"].value_counts().sort_index().reset_index()
-        rating_counts.columns = ["Rating", "Count"]
-        
-        fig = px.bar(
-            rating_counts,
-            x="Rating",
-            y="Count",
-            color="Rating",
-            color_continuous_scale="RdYlGn"
-        )
-        fig.update_layout(height=300, showlegend=False)
-        fig.update_coloraxes(showscale=False)
-        st.plotly_chart(fig, use_container_width=True)
+    if group_stats is not None:
+        rating_counts = rating_counts_by_group.loc[group_key].sort_index()
+        st.plotly_chart(_rating_dist_fig(rating_counts, height=300), use_container_width=True, config={"staticPlot": True})